@@ -11,17 +11,25 @@ Usage:
 
 Required packages:
     pip install PyMuPDF PyQt5
+
+Optional packages:
+    pip install numpy                      # pixel array helpers
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import struct
 import sys
+import threading
+import time
 import weakref
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Set, Tuple, cast
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set, Tuple, cast
 
 try:
     from PyQt5 import QtCore, QtGui, QtWidgets, QtPrintSupport, QtNetwork  # type: ignore
@@ -33,6 +41,11 @@ try:
 except ImportError as exc:  # pragma: no cover - import guard.
     raise SystemExit("PyMuPDF is required. Install with 'pip install PyMuPDF'.") from exc
 
+try:
+    import numpy as np  # type: ignore  # optional: vectorized pixel work
+except ImportError:  # pragma: no cover - optional dependency.
+    np = None
+
 
 # ---- Qt helpers ----------------------------------------------------------------
 
@@ -84,36 +97,36 @@ def exec_qapplication(app: QtWidgets.QApplication) -> int:
 # ---- Utility functions --------------------------------------------------------
 
 def normalize_path(path: Path) -> Path:
-    """Return an absolute path even if the file does not currently exist."""
-    candidate = Path(path).expanduser()
+    """Return the canonical absolute path even if the file does not currently exist.
+
+    Symlinks are resolved so one file opened through different links maps to
+    one key. The case is left alone for display; on Windows ``Path`` objects
+    already compare and hash case-insensitively, so keys built from the
+    result behave like ``normcase(realpath(...))``.
+    """
+    text = os.path.expanduser(os.fspath(path))
+    if not os.path.isabs(text):
+        try:
+            text = os.path.abspath(text)
+        except OSError:  # current directory vanished
+            return Path(text)
+    return _normalize_path_cached(text)
 
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_path_cached(text: str) -> Path:
     # UNC paths often trigger authentication when resolved; leave them as-is.
-    candidate_text = str(candidate)
-    if candidate_text.startswith(("\\\\", "//")):
-        decoded_text = _decode_unc_hostname(candidate_text)
-        if decoded_text != candidate_text:
+    if text.startswith(("\\\\", "//")):
+        decoded_text = _decode_unc_hostname(text)
+        if decoded_text != text:
             return Path(decoded_text)
-        return candidate
-
-    try:
-        return candidate.resolve(strict=True)
-    except FileNotFoundError:
-        pass
-    except OSError:
-        pass
+        return Path(text)
 
+    # realpath stats each component; the cache keeps that off hot paths.
     try:
-        return candidate.resolve(strict=False)
-    except (OSError, RuntimeError):
-        pass
-
-    if candidate.is_absolute():
-        return candidate
-
-    try:
-        return Path.cwd() / candidate
-    except OSError:
-        return candidate
+        return Path(os.path.realpath(text))
+    except (OSError, ValueError):
+        return Path(os.path.abspath(text))
 
 
 def _decode_unc_hostname(text: str) -> str:
@@ -181,6 +194,20 @@ def _display_path_text(path: Path | str) -> str:
     return _decode_unc_hostname(text)
 
 
+# Pick the file-manager launcher once at import instead of on every request.
+if sys.platform.startswith("win"):
+
+    def _open_directory(directory: Path) -> None:
+        """Reveal a directory in the platform file manager."""
+        os.startfile(directory)  # type: ignore[attr-defined]
+
+else:
+    _OPEN_DIRECTORY_COMMAND = "open" if sys.platform == "darwin" else "xdg-open"
+
+    def _open_directory(directory: Path) -> None:
+        """Reveal a directory in the platform file manager."""
+        QtCore.QProcess.startDetached(_OPEN_DIRECTORY_COMMAND, [str(directory)])
+
 
 def read_bool_setting(store: QtCore.QSettings, key: str, default: bool) -> bool:
     value = store.value(key, default)
@@ -217,6 +244,7 @@ def get_application_icon() -> QtGui.QIcon:
 user_token = (os.environ.get('USERNAME') or os.environ.get('USER') or 'default')
 user_token = user_token.replace('\\', '_').replace('/', '_').replace(' ', '_')
 SINGLE_INSTANCE_SERVER = f'PdfVertViewSingleton_{user_token}'
+_FRAME_HEADER = struct.Struct(">I")  # byte length of the JSON request that follows
 
 
 class SingleInstanceHost(QtCore.QObject):
@@ -243,31 +271,42 @@ class SingleInstanceHost(QtCore.QObject):
             self._read_socket(connection)
             connection.disconnectFromServer()
             connection.close()
-            self._read_socket(connection)
-            connection.disconnectFromServer()
-            connection.close()
 
     def _read_socket(self, socket: QtNetwork.QLocalSocket) -> None:
-        if not socket.bytesAvailable():
-            if not socket.waitForReadyRead(200):
-                return
-        if not socket.bytesAvailable():
-            if not socket.waitForReadyRead(200):
-                return
-        data = bytes(socket.readAll())
+        data = self._read_frame(socket)
         if not data:
             return
         try:
             payload = json.loads(data.decode("utf-8"))
         except Exception:
             payload = []
+        raw_paths: object = []
+        if isinstance(payload, dict) and payload.get("op") == "open":
+            raw_paths = payload.get("paths")
+        elif isinstance(payload, list):  # pre-framing clients sent a bare list
+            raw_paths = payload
         paths: list[str] = []
-        if isinstance(payload, list):
-            paths = [str(item) for item in payload if isinstance(item, str)]
+        if isinstance(raw_paths, list):
+            paths = [str(item) for item in raw_paths if isinstance(item, str)]
         if paths:
             self.open_requested.emit(paths)
-        socket.flush()
-        socket.flush()
+
+    @staticmethod
+    def _read_frame(socket: QtNetwork.QLocalSocket) -> bytes:
+        """Read one length-prefixed request frame (or a legacy bare payload)."""
+        buffer = bytearray()
+        expected: Optional[int] = None
+        while socket.bytesAvailable() or socket.waitForReadyRead(200):
+            buffer += bytes(socket.readAll())
+            if expected is None and len(buffer) >= _FRAME_HEADER.size:
+                if buffer[:1] == b"[":
+                    continue
+                expected = _FRAME_HEADER.size + _FRAME_HEADER.unpack_from(buffer)[0]
+            if expected is not None and len(buffer) >= expected:
+                return bytes(buffer[_FRAME_HEADER.size:expected])
+        if buffer[:1] == b"[":
+            return bytes(buffer)
+        return b""
 
 
 def forward_paths_to_primary(paths: Iterable[Path]) -> bool:
@@ -279,7 +318,8 @@ def forward_paths_to_primary(paths: Iterable[Path]) -> bool:
     if not socket.waitForConnected(500):
         return False
     try:
-        payload = json.dumps(serialized).encode("utf-8")
+        body = json.dumps({"op": "open", "paths": serialized}).encode("utf-8")
+        payload = _FRAME_HEADER.pack(len(body)) + body
         if socket.write(payload) == -1:
             return False
         socket.flush()
@@ -293,34 +333,74 @@ def forward_paths_to_primary(paths: Iterable[Path]) -> bool:
 
 
 def qimage_from_pixmap(pix: fitz.Pixmap) -> QtGui.QImage:
-    """Convert a PyMuPDF pixmap to a deep-copied QImage."""
+    """Convert a PyMuPDF pixmap to a QImage that owns its pixels.
+
+    The QImage is built over ``samples_mv`` (no intermediate ``bytes``) and
+    copied exactly once, since PyQt5 cannot tie the pixmap's lifetime to the
+    image and renders are handed across threads.
+    """
     fmt = QtGui.QImage.Format_RGBA8888 if pix.alpha else QtGui.QImage.Format_RGB888
-    image = QtGui.QImage(pix.samples, pix.width, pix.height, pix.stride, fmt)
+    image = QtGui.QImage(pix.samples_mv, pix.width, pix.height, pix.stride, fmt)
     return image.copy()
 
 
+# Rounded tile backgrounds per (hue bucket, width, height); the letter is
+# drawn onto a copy, so the antialiased fill is rasterized once per bucket.
+LETTER_ICON_HUE_BUCKETS = 16
+_BG_TEMPLATES: Dict[Tuple[int, int, int], QtGui.QPixmap] = {}
+
+
+def pixmap_as_ndarray(pix: fitz.Pixmap) -> "np.ndarray":
+    """Expose a pixmap's samples as a ``(height, width, channels)`` uint8 array.
+
+    The array is a zero-copy view and is only valid while ``pix`` is alive.
+    Any per-pixel pass over rendered pages should go through this view and
+    numpy operations rather than Python loops. Requires numpy.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for pixel array access. Install with 'pip install numpy'.")
+    rows = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)
+    return rows[:, : pix.width * pix.n].reshape(pix.height, pix.width, pix.n)
+
+
 def create_letter_icon(text: str, size: QtCore.QSize = QtCore.QSize(56, 72)) -> QtGui.QIcon:
     """Generate a simple colored tile icon that uses the first letter of the text."""
     display = text.strip() or "?"
-    base = QtGui.QPixmap(size)
-    base.fill(Transparent)
-
     # Derive a stable color from the file name to help distinguish tabs.
-    hue = abs(hash(display.lower())) % 360
-    color = QtGui.QColor.fromHsv(hue, 180, 220)
+    bucket = abs(hash(display.lower())) % 360 * LETTER_ICON_HUE_BUCKETS // 360
+    return _letter_icon(display[0].upper(), bucket, size.width(), size.height())
+
+
+def _letter_tile_background(bucket: int, width: int, height: int) -> QtGui.QPixmap:
+    key = (bucket, width, height)
+    template = _BG_TEMPLATES.get(key)
+    if template is None:
+        template = QtGui.QPixmap(width, height)
+        template.fill(Transparent)
+        hue = bucket * 360 // LETTER_ICON_HUE_BUCKETS
+        painter = QtGui.QPainter(template)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setBrush(QtGui.QColor.fromHsv(hue, 180, 220))
+        painter.setPen(NoPen)
+        painter.drawRoundedRect(template.rect().adjusted(1, 1, -1, -1), 12, 12)
+        painter.end()
+        _BG_TEMPLATES[key] = template
+    return template
+
+
+@functools.lru_cache(maxsize=128)
+def _letter_icon(letter: str, bucket: int, width: int, height: int) -> QtGui.QIcon:
+    # Tabs with the same letter and color share one painted tile.
+    base = QtGui.QPixmap(_letter_tile_background(bucket, width, height))
 
     painter = QtGui.QPainter(base)
     painter.setRenderHint(QtGui.QPainter.Antialiasing)
-    painter.setBrush(color)
-    painter.setPen(NoPen)
-    painter.drawRoundedRect(base.rect().adjusted(1, 1, -1, -1), 12, 12)
-
     painter.setPen(QtCore.Qt.white)
     font = painter.font()
     font.setBold(True)
-    font.setPointSizeF(size.height() * 0.42)
+    font.setPointSizeF(height * 0.42)
     painter.setFont(font)
-    painter.drawText(base.rect(), AlignCenter, display[0].upper())
+    painter.drawText(base.rect(), AlignCenter, letter)
     painter.end()
 
     return QtGui.QIcon(base)
@@ -329,6 +409,32 @@ def create_letter_icon(text: str, size: QtCore.QSize = QtCore.QSize(56, 72)) ->
 # ---- PDF domain objects -------------------------------------------------------
 
 
+# QImage formats whose pixel layout MuPDF renders directly, with their sizes.
+RENDER_BYTES_PER_PIXEL = {
+    QtGui.QImage.Format_RGB888: 3,
+    QtGui.QImage.Format_RGBA8888: 4,
+}
+
+# Image writer and render format per export suffix. Every writer accepts the
+# alpha-free RGB888 layout MuPDF produces, so exports never convert pixels.
+EXPORT_IMAGE_FORMATS = {
+    ".png": ("PNG", QtGui.QImage.Format_RGB888),
+    ".jpg": ("JPG", QtGui.QImage.Format_RGB888),
+    ".jpeg": ("JPG", QtGui.QImage.Format_RGB888),
+    ".bmp": ("BMP", QtGui.QImage.Format_RGB888),
+}
+
+# Image formats a QPixmap can adopt without re-encoding the pixels.
+PIXMAP_NATIVE_FORMATS = {
+    QtGui.QImage.Format_RGB32,
+    QtGui.QImage.Format_ARGB32_Premultiplied,
+}
+
+# PyMuPDF is not thread-safe: once pages are rendered on pool threads every
+# call into MuPDF, from any thread, has to be serialized through this lock.
+_FITZ_LOCK = threading.RLock()
+
+
 @dataclass
 class PdfDocument:
     """Container for an opened PDF document and related assets."""
@@ -336,50 +442,186 @@ class PdfDocument:
     path: Path
     document: fitz.Document
     display_name: str
-    thumbnail: QtGui.QIcon
+    icon_label: str
+    # Recently loaded pages, so paging does not reparse the page dictionary.
+    _page_cache: OrderedDict[int, fitz.Page] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    # Page rects read once at open (and after rotation); the GUI thread sizes
+    # pages from these without waiting on a render that holds _FITZ_LOCK.
+    _page_rects: list = field(default_factory=list, init=False, repr=False, compare=False)
+    # Scale matrices by zoom; the viewer renders at a handful of zoom levels.
+    _matrix_cache: Dict[float, fitz.Matrix] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    PAGE_CACHE_SIZE = 16
+    MATRIX_CACHE_SIZE = 32
+
+    def __post_init__(self) -> None:
+        with _FITZ_LOCK:
+            self._page_rects = [
+                self.document.load_page(index).rect for index in range(self.document.page_count)
+            ]
 
     @classmethod
     def open(cls, file_path: Path) -> "PdfDocument":
-        doc = fitz.open(_prepare_filesystem_path(file_path))  # Raises if the file cannot be opened.
-        metadata = doc.metadata or {}
+        with _FITZ_LOCK:
+            doc = fitz.open(_prepare_filesystem_path(file_path))  # Raises if the file cannot be opened.
+            metadata = doc.metadata or {}
         title_text = (metadata.get("title") or "").strip()
         display = file_path.name
         icon_label = title_text or file_path.stem or display
-        thumb = cls._build_thumbnail_icon(doc, icon_label)
-        return cls(path=file_path, document=doc, display_name=display, thumbnail=thumb)
+        return cls(path=file_path, document=doc, display_name=display, icon_label=icon_label)
 
     @staticmethod
-    def _build_thumbnail_icon(doc: fitz.Document, display: str) -> QtGui.QIcon:
-        """Render a small preview icon; fall back to an initial letter tile."""
-        try:
-            page = doc.load_page(0)
+    def _placeholder_icon(display: str) -> QtGui.QIcon:
+        """Letter tile shown until the page preview has been rendered."""
+        return create_letter_icon(display)
+
+    @property
+    def thumbnail_key(self) -> str:
+        """Key of the rendered preview in the application-wide ``QPixmapCache``."""
+        return f"pdf_vertview/thumbnail/{self.path}"
+
+    def cached_thumbnail(self) -> Optional[QtGui.QPixmap]:
+        pixmap = QtGui.QPixmapCache.find(self.thumbnail_key)
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+
+    @property
+    def thumbnail(self) -> QtGui.QIcon:
+        """Rendered preview if still cached, otherwise the letter tile."""
+        pixmap = self.cached_thumbnail()
+        if pixmap is None:
+            return self._placeholder_icon(self.icon_label)
+        return QtGui.QIcon(pixmap)
+
+    def render_thumbnail(self) -> QtGui.QImage:
+        """Render a small preview of the first page; safe to call off the GUI thread."""
+        with _FITZ_LOCK:
+            page = self._get_page(0)
             zoom = 64 / max(page.rect.height, 1)
-            matrix = fitz.Matrix(zoom, zoom)
+            matrix = self._scale_matrix(zoom)
             pix = page.get_pixmap(matrix=matrix, alpha=False)
-            img = qimage_from_pixmap(pix)
-            return QtGui.QIcon(QtGui.QPixmap.fromImage(img))
-        except Exception:
-            return create_letter_icon(display)
+            return qimage_from_pixmap(pix)
 
     @property
     def page_count(self) -> int:
-        return self.document.page_count
+        return len(self._page_rects)
 
-    def render_page(self, index: int, zoom: float) -> QtGui.QImage:
-        page = self.document.load_page(index)
-        matrix = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=matrix, alpha=False)
-        return qimage_from_pixmap(pix)
+    def render_page(
+        self,
+        index: int,
+        zoom: float,
+        target_format: QtGui.QImage.Format = QtGui.QImage.Format_RGB888,
+    ) -> QtGui.QImage:
+        alpha = target_format == QtGui.QImage.Format_RGBA8888
+        with _FITZ_LOCK:
+            page = self._get_page(index)
+            matrix = self._scale_matrix(zoom)
+            pix = page.get_pixmap(matrix=matrix, alpha=alpha)
+            image = qimage_from_pixmap(pix)
+        if image.format() != target_format:
+            image = image.convertToFormat(target_format)
+        return image
+
+    def _get_page(self, index: int) -> fitz.Page:
+        """Return page ``index`` from the LRU of loaded pages; hold ``_FITZ_LOCK``."""
+        page = self._page_cache.get(index)
+        if page is None:
+            page = self.document.load_page(index)
+            self._page_cache[index] = page
+            if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        else:
+            self._page_cache.move_to_end(index)
+        return page
+
+    def _scale_matrix(self, zoom: float) -> fitz.Matrix:
+        matrix = self._matrix_cache.get(zoom)
+        if matrix is None:
+            if len(self._matrix_cache) >= self.MATRIX_CACHE_SIZE:
+                self._matrix_cache.clear()
+            matrix = self._matrix_cache[zoom] = fitz.Matrix(zoom, zoom)
+        return matrix
+
+    def render_page_tiles(
+        self, index: int, zoom: float, rows: int = 3, columns: int = 2
+    ) -> Iterator[Tuple[int, int, QtGui.QImage]]:
+        """Yield ``(x, y, image)`` tiles of a page rendered at ``zoom``.
+
+        The page is interpreted once into a display list; each tile is then
+        rasterized from it with its own lock acquisition, so other MuPDF work
+        can interleave between tiles. MuPDF antialiases clipped strokes a
+        little differently, so the assembled page is not pixel-identical to a
+        single-pass render, though the difference is not visible.
+        """
+        with _FITZ_LOCK:
+            page = self._get_page(index)
+            display_list = page.get_displaylist()
+            rect = page.rect
+            matrix = self._scale_matrix(zoom)
+            origin = (rect * matrix).irect
+        tile_width = rect.width / columns
+        tile_height = rect.height / rows
+        for row in range(rows):
+            for column in range(columns):
+                clip = fitz.Rect(
+                    rect.x0 + column * tile_width,
+                    rect.y0 + row * tile_height,
+                    rect.x0 + (column + 1) * tile_width,
+                    rect.y0 + (row + 1) * tile_height,
+                )
+                with _FITZ_LOCK:
+                    pix = display_list.get_pixmap(matrix=matrix, alpha=False, clip=clip)
+                    image = qimage_from_pixmap(pix)
+                yield pix.x - origin.x0, pix.y - origin.y0, image
 
     def page_rect(self, index: int) -> fitz.Rect:
-        return self.document.load_page(index).rect
+        return self._page_rects[index]
+
+    def page_pixel_size(self, index: int, zoom: float) -> Tuple[int, int]:
+        """Return the pixel size of a page rendered at the supplied zoom."""
+        irect = (self.page_rect(index) * self._scale_matrix(zoom)).irect
+        return irect.width, irect.height
+
+    def render_page_into(
+        self,
+        index: int,
+        zoom: float,
+        out_buf: bytearray,
+        target_format: QtGui.QImage.Format = QtGui.QImage.Format_RGB888,
+    ) -> QtGui.QImage:
+        """Render a page into a caller-provided buffer and return a QImage view of it.
+
+        ``target_format`` must be one MuPDF renders natively (RGB888 or
+        RGBA8888). The buffer must hold at least ``width * height`` times the
+        format's bytes per pixel (see ``page_pixel_size``) and must outlive the
+        returned image, which shares its memory instead of owning a copy.
+        """
+        if target_format not in RENDER_BYTES_PER_PIXEL:
+            raise ValueError("Unsupported render target format.")
+        alpha = target_format == QtGui.QImage.Format_RGBA8888
+        with _FITZ_LOCK:
+            page = self._get_page(index)
+            matrix = self._scale_matrix(zoom)
+            pix = page.get_pixmap(matrix=matrix, alpha=alpha)
+        size = pix.stride * pix.height
+        view = memoryview(out_buf)
+        if len(view) < size:
+            raise ValueError("Render buffer is too small for the requested page.")
+        view[:size] = pix.samples_mv
+        return QtGui.QImage(out_buf, pix.width, pix.height, pix.stride, target_format)
 
     def get_page_text(self, index: int) -> str:
         """Extract all text from a page."""
         if index < 0 or index >= self.page_count:
             return ""
-        page = self.document.load_page(index)
-        return page.get_text()
+        with _FITZ_LOCK:
+            page = self._get_page(index)
+            return page.get_text()
 
     def search_text(self, query: str, page_index: int = -1) -> list:
         """
@@ -401,9 +643,10 @@ class PdfDocument:
         
         for idx in range(start_page, end_page):
             try:
-                page = self.document.load_page(idx)
-                # search_for returns a list of rectangles for each match
-                rects = page.search_for(query)
+                with _FITZ_LOCK:
+                    page = self.document.load_page(idx)
+                    # search_for returns a list of rectangles for each match
+                    rects = page.search_for(query)
                 if rects:
                     results.append((idx, rects))
             except Exception:
@@ -415,30 +658,34 @@ class PdfDocument:
         """Get text blocks with their positions on a page."""
         if index < 0 or index >= self.page_count:
             return []
-        page = self.document.load_page(index)
-        # Get text with layout info - returns list of blocks
-        try:
-            text_dict = page.get_text("dict")
-            blocks = text_dict.get("blocks", [])
-            return blocks
-        except Exception:
-            return []
+        with _FITZ_LOCK:
+            page = self._get_page(index)
+            # Get text with layout info - returns list of blocks
+            try:
+                text_dict = page.get_text("dict")
+                blocks = text_dict.get("blocks", [])
+                return blocks
+            except Exception:
+                return []
 
     def get_text_in_rect(self, page_index: int, rect: tuple) -> str:
         """Extract text within a specified rectangle on a page."""
         if page_index < 0 or page_index >= self.page_count:
             return ""
         try:
-            page = self.document.load_page(page_index)
-            # rect should be (x0, y0, x1, y1)
-            fitz_rect = fitz.Rect(rect)
-            text = page.get_text("text", clip=fitz_rect)
+            with _FITZ_LOCK:
+                page = self._get_page(page_index)
+                # rect should be (x0, y0, x1, y1)
+                fitz_rect = fitz.Rect(rect)
+                text = page.get_text("text", clip=fitz_rect)
             return text.strip()
         except Exception:
             return ""
 
     def close(self) -> None:
-        self.document.close()
+        with _FITZ_LOCK:
+            self._page_cache.clear()
+            self.document.close()
 
     def save_as(self, destination: Path) -> None:
         """Save the current document to a new path."""
@@ -452,7 +699,8 @@ class PdfDocument:
         if parent and not str(dest).startswith("\\\\"):
             parent.mkdir(parents=True, exist_ok=True)
 
-        self.document.save(_prepare_filesystem_path(dest))
+        with _FITZ_LOCK:
+            self.document.save(_prepare_filesystem_path(dest))
 
     def rotate_document(self, degrees: int) -> None:
         """Rotate every page in the document by the supplied degrees."""
@@ -462,9 +710,14 @@ class PdfDocument:
         if step % 90 != 0:
             raise ValueError("Rotation must be a multiple of 90 degrees.")
 
-        for index in range(self.page_count):
-            page = self.document.load_page(index)
-            self._set_page_rotation(page, (page.rotation + step) % 360)
+        with _FITZ_LOCK:
+            rects = []
+            for index in range(self.page_count):
+                page = self.document.load_page(index)
+                self._set_page_rotation(page, (page.rotation + step) % 360)
+                rects.append(page.rect)
+            self._page_cache.clear()
+            self._page_rects = rects
 
     def rotate_page(self, index: int, degrees: int) -> None:
         """Rotate a single page by the supplied degrees."""
@@ -476,8 +729,10 @@ class PdfDocument:
         if step % 90 != 0:
             raise ValueError("Rotation must be a multiple of 90 degrees.")
 
-        page = self.document.load_page(index)
-        self._set_page_rotation(page, (page.rotation + step) % 360)
+        with _FITZ_LOCK:
+            page = self._get_page(index)
+            self._set_page_rotation(page, (page.rotation + step) % 360)
+            self._page_rects[index] = page.rect
 
     @staticmethod
     def _set_page_rotation(page: fitz.Page, rotation: int) -> None:
@@ -488,14 +743,129 @@ class PdfDocument:
             page.setRotation(rotation)
 
 
-@dataclass(frozen=True)
+class PageRenderJobSignals(QtCore.QObject):
+    """Tells the GUI thread a ``PageRenderJob`` is done with its buffer."""
+
+    # PageRenderJob
+    finished = QtCore.pyqtSignal(object)
+
+
+class PageRenderJob(QtCore.QRunnable):
+    """Render a page into a buffer on a pool thread and hold the result for later."""
+
+    def __init__(
+        self,
+        document: PdfDocument,
+        index: int,
+        zoom: float,
+        buffer: bytearray,
+        target_format: QtGui.QImage.Format = QtGui.QImage.Format_RGB888,
+        signals: Optional[PageRenderJobSignals] = None,
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.document = document
+        self.index = index
+        self.zoom = zoom
+        self.buffer = buffer
+        self.target_format = target_format
+        self.signals = signals
+        self._image: Optional[QtGui.QImage] = None
+        self._error: Optional[Exception] = None
+        self._cancelled = False
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        try:
+            # Abandoned while still queued: skip the render entirely.
+            if not self._cancelled:
+                self._image = self.document.render_page_into(
+                    self.index, self.zoom, self.buffer, self.target_format
+                )
+        except Exception as exc:  # surfaced to the caller by result()
+            self._error = exc
+        finally:
+            self._done.set()
+            if self.signals is not None:
+                try:
+                    self.signals.finished.emit(self)
+                except RuntimeError:  # window already destroyed
+                    pass
+
+    def cancel(self) -> None:
+        """Mark the result as unwanted; a render already running still finishes."""
+        self._cancelled = True
+
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self) -> QtGui.QImage:
+        """Block until the render finishes and return the image or raise its error."""
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return cast(QtGui.QImage, self._image)
+
+
+class ThumbnailSignals(QtCore.QObject):
+    """Delivers rendered tab thumbnails back to the GUI thread."""
+
+    # document, QImage
+    finished = QtCore.pyqtSignal(object, object)
+
+
+class ThumbnailTask(QtCore.QRunnable):
+    """Render a document's tab thumbnail on a pool thread."""
+
+    def __init__(self, signals: ThumbnailSignals, document: PdfDocument) -> None:
+        super().__init__()
+        self.signals = signals
+        self.document = document
+
+    def run(self) -> None:
+        try:
+            image = self.document.render_thumbnail()
+        except Exception:
+            return  # closed or unreadable: the letter tile stays
+        try:
+            self.signals.finished.emit(self.document, image)
+        except RuntimeError:  # window already destroyed
+            pass
+
+
 class FileIdentity:
     """Lightweight fingerprint for tracking files across renames."""
 
-    device: int
-    inode: int
-    size: int
-    mtime_ns: int
+    __slots__ = ("device", "inode", "size", "mtime_ns", "_hash")
+
+    MTIME_TOL_NS = 1_000_000  # mtime slack when inodes cannot be compared
+
+    def __init__(self, device: int, inode: int, size: int, mtime_ns: int) -> None:
+        self.device = device
+        self.inode = inode
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self._hash = hash((device, inode, size, mtime_ns))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FileIdentity):
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self.device == other.device
+            and self.inode == other.inode
+            and self.size == other.size
+            and self.mtime_ns == other.mtime_ns
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"FileIdentity(device={self.device}, inode={self.inode}, "
+            f"size={self.size}, mtime_ns={self.mtime_ns})"
+        )
 
     @classmethod
     def from_path(cls, path: Path) -> Optional["FileIdentity"]:
@@ -517,27 +887,170 @@ class FileIdentity:
             mtime_ns=mtime_ns,
         )
 
+    def same_file(self, other: "FileIdentity") -> bool:
+        """True when both identities name the same inode on the same device."""
+        # A nonzero inode equal to the other's implies the other is nonzero too.
+        return bool(self.inode) and self.inode == other.inode and self.device == other.device
+
     def matches(self, other: "FileIdentity") -> bool:
-        inode_match = (
-            self.inode
-            and other.inode
-            and self.inode == other.inode
-            and self.device == other.device
-        )
-        if inode_match:
+        if self.same_file(other):
             return True
-        if self.size != other.size:
-            return False
-        return abs(self.mtime_ns - other.mtime_ns) <= 1_000_000
+        return self.size == other.size and abs(self.mtime_ns - other.mtime_ns) <= self.MTIME_TOL_NS
 
 
 # ---- Viewer widgets -----------------------------------------------------------
 
+class RenderSignals(QtCore.QObject):
+    """Carries finished page renders from pool threads back to the GUI thread."""
+
+    # document, cache key, ticket, QImage
+    finished = QtCore.pyqtSignal(object, object, int, object)
+    # generation, document, full page size, tile position, tile QImage
+    tile = QtCore.pyqtSignal(int, object, object, object, object)
+    # cache key, ticket, error message
+    failed = QtCore.pyqtSignal(object, int, str)
+    # cache key and ticket of a request superseded before it finished
+    cancelled = QtCore.pyqtSignal(object, int)
+
+
+class RenderTask(QtCore.QRunnable):
+    """Render one page on a pool thread and report it through ``RenderSignals``."""
+
+    def __init__(
+        self,
+        signals: RenderSignals,
+        document: PdfDocument,
+        page_index: int,
+        zoom: float,
+        key: Tuple[int, int, float, float],
+        ticket: int,
+        generation: int,
+        current_generation: Callable[[], int],
+        prefetch: bool = False,
+        tiled: bool = False,
+    ) -> None:
+        super().__init__()
+        self.signals = signals
+        self.document = document
+        self.page_index = page_index
+        self.zoom = zoom
+        self.key = key
+        self.ticket = ticket
+        self.generation = generation
+        self.prefetch = prefetch
+        self.tiled = tiled
+        self._current_generation = current_generation
+
+    def run(self) -> None:
+        # A newer page request superseded this one while it waited in the
+        # queue. Prefetches always run: their result still fills the cache.
+        if not self.prefetch and self._current_generation() != self.generation:
+            self._emit(self.signals.cancelled, self.key, self.ticket)
+            return
+        try:
+            if self.tiled:
+                image = self._render_tiles()
+                if image is None:
+                    self._emit(self.signals.cancelled, self.key, self.ticket)
+                    return
+            else:
+                image = self.document.render_page(self.page_index, self.zoom)
+        except Exception as exc:
+            self._emit(self.signals.failed, self.key, self.ticket, str(exc))
+            return
+        self._emit(self.signals.finished, self.document, self.key, self.ticket, image)
+
+    def _render_tiles(self) -> Optional[QtGui.QImage]:
+        """Assemble the page tile by tile, showing each tile as it completes."""
+        width, height = self.document.page_pixel_size(self.page_index, self.zoom)
+        full_size = QtCore.QSize(width, height)
+        image = QtGui.QImage(full_size, QtGui.QImage.Format_RGB888)
+        image.fill(QtCore.Qt.white)
+        painter = QtGui.QPainter(image)
+        try:
+            for x, y, tile in self.document.render_page_tiles(self.page_index, self.zoom):
+                if self._current_generation() != self.generation:
+                    return None
+                painter.drawImage(x, y, tile)
+                self._emit(
+                    self.signals.tile, self.generation, self.document, full_size, QtCore.QPoint(x, y), tile
+                )
+        finally:
+            painter.end()
+        return image
+
+    @staticmethod
+    def _emit(signal: QtCore.pyqtBoundSignal, *args: object) -> None:
+        try:
+            signal.emit(*args)
+        except RuntimeError:  # viewer already destroyed
+            pass
+
+
+class PageImageLabel(QtWidgets.QLabel):
+    """QLabel that paints a page pixmap it owns, so tiles can be drawn into it in place.
+
+    ``QLabel.setPixmap`` keeps a shared copy, and painting into the caller's
+    pixmap afterwards would detach it. This label keeps the caller's pixmap
+    itself; ``update_page_area`` repaints just the part that changed.
+    """
+
+    def __init__(self, text: str = "", parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(text, parent)
+        self._page_pixmap: Optional[QtGui.QPixmap] = None
+
+    def setPixmap(self, pixmap: QtGui.QPixmap) -> None:  # type: ignore[override]
+        self._page_pixmap = None if pixmap.isNull() else pixmap
+        super().setText("")
+        self.update()
+
+    def setText(self, text: str) -> None:  # type: ignore[override]
+        self._page_pixmap = None
+        super().setText(text)
+
+    def pixmap(self) -> Optional[QtGui.QPixmap]:  # type: ignore[override]
+        return self._page_pixmap
+
+    def _page_target_rect(self) -> QtCore.QRect:
+        pixmap = cast(QtGui.QPixmap, self._page_pixmap)
+        ratio = pixmap.devicePixelRatio() or 1.0
+        size = QtCore.QSize(round(pixmap.width() / ratio), round(pixmap.height() / ratio))
+        return QtWidgets.QStyle.alignedRect(
+            self.layoutDirection(), self.alignment(), size, self.contentsRect()
+        )
+
+    def update_page_area(self, device_rect: QtCore.QRect) -> None:
+        """Schedule a repaint of ``device_rect``, given in the pixmap's device pixels."""
+        if self._page_pixmap is None:
+            return
+        ratio = self._page_pixmap.devicePixelRatio() or 1.0
+        target = self._page_target_rect()
+        logical = QtCore.QRectF(
+            device_rect.x() / ratio,
+            device_rect.y() / ratio,
+            device_rect.width() / ratio,
+            device_rect.height() / ratio,
+        ).toAlignedRect()
+        self.update(logical.translated(target.topLeft()).adjusted(-1, -1, 1, 1))
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # type: ignore[override]
+        if self._page_pixmap is None:
+            super().paintEvent(event)
+            return
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(self._page_target_rect(), self._page_pixmap)
+        painter.end()
+
+
 class PdfViewerWidget(QtWidgets.QWidget):
     """Central widget that shows the current PDF page and exposes viewer actions."""
 
     MIN_ZOOM = 0.2
     MAX_ZOOM = 6.0
+    PAGE_CACHE_BUDGET = 256 * 1024 * 1024  # bytes of rendered pages kept around
+    RENDER_PRIORITY = 10
+    PREFETCH_PRIORITY = 0
+    TILED_RENDER_MIN_PIXELS = 4_000_000  # larger pages are shown tile by tile
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
@@ -547,9 +1060,45 @@ class PdfViewerWidget(QtWidgets.QWidget):
         self._default_fit_mode: str = "page"
         self._fit_mode: Optional[str] = None  # "width", "page", or None
         self._pending_fit_update: bool = False
+        # Inputs and result of the last fit, so resize ticks that barely move
+        # the viewport do not trigger a new rasterization.
+        self._last_fit_key: Optional[Tuple[int, int, str, float, float]] = None
+        self._last_fit_viewport: Tuple[int, int] = (0, 0)
+        self._last_fit_zoom: float = 0.0
         self._panning_active: bool = False
         self._last_pan_pos = QtCore.QPoint()
         self._page_indicator_text: str = ""
+        self._elide_cache: Tuple[str, int, str] = ("", 0, "")
+
+        # Pages are rasterized on pool threads. Queued page requests that were
+        # superseded (newer generation) give up; finished renders are cached.
+        self._render_pool = QtCore.QThreadPool(self)
+        self._render_pool.setMaxThreadCount(min(8, os.cpu_count() or 1))
+        self._render_generation: int = 0
+        self._render_signals = RenderSignals(self)
+        self._render_signals.finished.connect(self._on_page_rendered)
+        self._render_signals.failed.connect(self._on_page_render_failed)
+        self._render_signals.tile.connect(self._on_page_tile_rendered)
+        self._render_signals.cancelled.connect(self._on_page_render_cancelled)
+        # Renders queued or running, by cache key, so a page whose prefetch is
+        # still in flight is not queued a second time. The ticket identifies
+        # the request; results whose ticket was dropped by invalidate_document
+        # are stale and discarded. The page on screen is the wanted key.
+        self._renders_in_flight: Dict[Tuple[int, int, float, float], int] = {}
+        self._render_ticket = 0
+        self._wanted_page_key: Optional[Tuple[int, int, float, float]] = None
+        # Large pages are painted tile by tile into this pixmap, which the
+        # page label shows directly while the render is in progress.
+        self._progressive_pixmap: Optional[QtGui.QPixmap] = None
+        self._progressive_generation: int = 0
+        # Rendered pages (without overlays) keyed by
+        # (id(document), page, render zoom, device pixel ratio).
+        # Images rather than pixmaps, so prefetched pages only pay for the
+        # pixmap upload if they are actually shown.
+        self._page_image_cache: OrderedDict[Tuple[int, int, float, float], QtGui.QImage] = OrderedDict()
+        self._page_image_cache_bytes: int = 0
+        self._shown_page_key: Optional[Tuple[int, int, float, float]] = None
+        self._shown_page_pixmap: Optional[QtGui.QPixmap] = None
         
         # Text search and selection support
         self._search_results: list = []
@@ -562,7 +1111,7 @@ class PdfViewerWidget(QtWidgets.QWidget):
         self._selected_text_cache: str = ""
         self._selection_boxes: list[QtCore.QRectF] = []  # highlight rectangles in image coords
 
-        self._image_label = QtWidgets.QLabel(
+        self._image_label = PageImageLabel(
             "Open a PDF or drag & drop to begin\n\n기본기능에서 PDF파일을 열기 하거나, 드래그&드롭으로 가져올 수 있습니다"
         )
         self._image_label.setAlignment(AlignCenter)
@@ -716,33 +1265,23 @@ class PdfViewerWidget(QtWidgets.QWidget):
             super().wheelEvent(event)
             return
 
-        modifiers = event.modifiers()
         angle_delta = event.angleDelta()
         delta = angle_delta.y() or angle_delta.x()
-        ctrl_pressed = modifiers & QtCore.Qt.ControlModifier
-
-        if ctrl_pressed:
-            if delta > 0:
-                self.zoom_in()
-            elif delta < 0:
-                self.zoom_out()
-            event.accept()
-            return
-
-        if delta == 0:
+        ctrl_pressed = bool(event.modifiers() & QtCore.Qt.ControlModifier)
+        action = _WHEEL_ACTIONS.get((ctrl_pressed, (delta > 0) - (delta < 0)))
+        if action is not None:
+            action(self)
+        elif not ctrl_pressed:
             super().wheelEvent(event)
             return
-
-        if delta > 0:
-            self.go_to_previous_page()
-        else:
-            self.go_to_next_page()
         event.accept()
 
     # -- document lifecycle --------------------------------------------------
 
     def load_document(self, document: PdfDocument) -> None:
+        self._render_generation += 1
         self._document = document
+        self._last_fit_key = None
         self._page_index = 0
         self._zoom = 1.0
         self._pending_fit_update = False
@@ -752,7 +1291,11 @@ class PdfViewerWidget(QtWidgets.QWidget):
         self._sync_page_scrollbar()
 
     def clear(self) -> None:
+        self._render_generation += 1
         self._document = None
+        self._wanted_page_key = None
+        self._progressive_pixmap = None
+        self._last_fit_key = None
         if self._panning_active:
             self._panning_active = False
             self._scroll_area.viewport().unsetCursor()
@@ -864,21 +1407,221 @@ class PdfViewerWidget(QtWidgets.QWidget):
             self.clear()
             return
 
-        try:
-            image = self._document.render_page(self._page_index, self._zoom)
-        except Exception as exc:  # pragma: no cover - defensive UI path.
-            QtWidgets.QMessageBox.critical(self, "Rendering error", str(exc))
+        zoom = self._render_zoom()
+        cache_key = self._page_cache_key(self._document, self._page_index, zoom)
+        if cache_key != self._wanted_page_key:
+            # Only a different page or zoom supersedes queued renders; asking
+            # for the same page again (search refresh, selection release)
+            # lets a tiled render in progress keep filling its pixmap.
+            self._render_generation += 1
+            self._wanted_page_key = cache_key
+        cached = self._page_image_cache.get(cache_key)
+        if cached is not None:
+            self._page_image_cache.move_to_end(cache_key)
+            self._present_page_pixmap(self._page_pixmap(cache_key, cached))
+            self._prefetch_neighbor_pages()
+        elif cache_key not in self._renders_in_flight:
+            # The previous pixmap stays on screen until the new render (or,
+            # for large pages, its first tile) arrives. A render already in
+            # flight for this key (e.g. a prefetch) is shown when it lands.
+            width, height = self._document.page_pixel_size(self._page_index, zoom)
+            self._start_render(
+                self._page_index,
+                zoom,
+                cache_key,
+                tiled=width * height >= self.TILED_RENDER_MIN_PIXELS,
+            )
+        self._page_indicator_text = (
+            f"{self._document.display_name} — Page {self._page_index + 1} / {self._document.page_count}  "
+            f"(zoom: {self._zoom * 100:.0f}%)"
+        )
+        self._update_page_indicator_label()
+        self._update_action_states()
+        self._sync_page_scrollbar()
+
+    def _current_render_generation(self) -> int:
+        return self._render_generation
+
+    def _render_zoom(self) -> float:
+        """Zoom pages are rasterized at: the logical zoom in device pixels.
+
+        It is quantized to the cache key's precision, so every image stored
+        under a key was rendered at exactly the scale the key names.
+        """
+        return round(self._zoom * self.devicePixelRatioF(), 2)
+
+    def _page_pixel_ratio(self) -> float:
+        return round(self.devicePixelRatioF(), 2)
+
+    def _page_scale(self) -> float:
+        """PDF points to logical pixels of the page as rendered.
+
+        Overlays and hit tests map through this rather than ``_zoom`` so they
+        stay aligned with the quantized render.
+        """
+        return self._render_zoom() / self._page_pixel_ratio()
+
+    def _start_render(
+        self,
+        page_index: int,
+        zoom: float,
+        key: Tuple[int, int, float, float],
+        prefetch: bool = False,
+        tiled: bool = False,
+    ) -> None:
+        self._render_ticket += 1
+        self._renders_in_flight[key] = self._render_ticket
+        self._render_pool.start(
+            RenderTask(
+                self._render_signals,
+                cast(PdfDocument, self._document),
+                page_index,
+                zoom,
+                key,
+                self._render_ticket,
+                self._render_generation,
+                self._current_render_generation,
+                prefetch=prefetch,
+                tiled=tiled,
+            ),
+            self.PREFETCH_PRIORITY if prefetch else self.RENDER_PRIORITY,
+        )
+
+    def _prefetch_neighbor_pages(self) -> None:
+        """Queue the pages on either side of the current one so flips hit the cache."""
+        if not self._document:
             return
+        zoom = self._render_zoom()
+        for page_index in (self._page_index + 1, self._page_index - 1):
+            if not 0 <= page_index < self._document.page_count:
+                continue
+            key = self._page_cache_key(self._document, page_index, zoom)
+            if key in self._page_image_cache or key in self._renders_in_flight:
+                continue
+            self._start_render(page_index, zoom, key, prefetch=True)
 
-        pixmap = QtGui.QPixmap.fromImage(image)
+    def _on_page_rendered(
+        self, document: object, key: Tuple[int, int, float, float], ticket: int, image: QtGui.QImage
+    ) -> None:
+        if not self._finish_render(key, ticket) or document is not self._document:
+            return
+        # Painting and layout then work in logical pixels at full device sharpness.
+        image.setDevicePixelRatio(key[3])
+        self._store_cached_image(key, image)
+        if key == self._wanted_page_key:
+            self._progressive_pixmap = None
+            self._present_page_pixmap(self._page_pixmap(key, image))
+            self._prefetch_neighbor_pages()
+
+    def _finish_render(self, key: Tuple[int, int, float, float], ticket: int) -> bool:
+        """Retire an in-flight render; False if its result is stale."""
+        if self._renders_in_flight.get(key) != ticket:
+            return False
+        del self._renders_in_flight[key]
+        return True
+
+    def _on_page_render_cancelled(self, key: Tuple[int, int, float, float], ticket: int) -> None:
+        if not self._finish_render(key, ticket):
+            return
+        # The page was flipped away from and back to while its render was
+        # queued; that render gave up, so request it again.
+        if key == self._wanted_page_key and self._document is not None:
+            self._render_current_page()
+
+    def _on_page_tile_rendered(
+        self,
+        generation: int,
+        document: object,
+        full_size: QtCore.QSize,
+        position: QtCore.QPoint,
+        tile: QtGui.QImage,
+    ) -> None:
+        if generation != self._render_generation or document is not self._document:
+            return
+        if self._progressive_pixmap is None or self._progressive_generation != generation:
+            pixmap = QtGui.QPixmap(full_size)
+            pixmap.setDevicePixelRatio(self._page_pixel_ratio())
+            pixmap.fill(QtCore.Qt.white)
+            self._progressive_pixmap = pixmap
+            self._progressive_generation = generation
+            # The label paints this very pixmap; tiles below land in place.
+            self._image_label.setPixmap(pixmap)
+            self._image_label.setMinimumSize(self._logical_size(pixmap))
+        painter = QtGui.QPainter(self._progressive_pixmap)
+        # Tiles are positioned in device pixels, not in the pixmap's logical units.
+        painter.scale(1 / self._page_pixel_ratio(), 1 / self._page_pixel_ratio())
+        painter.drawImage(position, tile)
+        painter.end()
+        self._image_label.update_page_area(QtCore.QRect(position, tile.size()))
+
+    def _on_page_render_failed(
+        self, key: Tuple[int, int, float, float], ticket: int, message: str
+    ) -> None:
+        if not self._finish_render(key, ticket) or key != self._wanted_page_key:
+            return
+        QtWidgets.QMessageBox.critical(self, "Rendering error", message)
+
+    def _page_cache_key(
+        self, document: PdfDocument, page_index: int, zoom: float
+    ) -> Tuple[int, int, float, float]:
+        # Zoom arrives quantized from _render_zoom, so repeated wheel steps land
+        # on the same entry; the device pixel ratio decides the image's logical size.
+        return (id(document), page_index, round(zoom, 2), self._page_pixel_ratio())
+
+    def _store_cached_image(self, key: Tuple[int, int, float, float], image: QtGui.QImage) -> None:
+        previous = self._page_image_cache.pop(key, None)
+        if previous is not None:
+            self._page_image_cache_bytes -= previous.sizeInBytes()
+        self._page_image_cache[key] = image
+        self._page_image_cache_bytes += image.sizeInBytes()
+        while self._page_image_cache_bytes > self.PAGE_CACHE_BUDGET and len(self._page_image_cache) > 1:
+            _, evicted = self._page_image_cache.popitem(last=False)
+            self._page_image_cache_bytes -= evicted.sizeInBytes()
+
+    def _page_pixmap(self, key: Tuple[int, int, float, float], image: QtGui.QImage) -> QtGui.QPixmap:
+        """Promote a cached page image to a pixmap, reusing the one on screen."""
+        if key != self._shown_page_key or self._shown_page_pixmap is None:
+            flags = (
+                QtCore.Qt.NoFormatConversion
+                if image.format() in PIXMAP_NATIVE_FORMATS
+                else QtCore.Qt.AutoColor
+            )
+            self._shown_page_pixmap = QtGui.QPixmap.fromImage(image, flags)
+            self._shown_page_key = key
+        return self._shown_page_pixmap
+
+    def invalidate_document(self, document: PdfDocument) -> None:
+        """Drop cached renders of ``document`` after it was modified or closed."""
+        doc_id = id(document)
+        # Renders still in flight were started from the old page content.
+        for key in [key for key in self._renders_in_flight if key[0] == doc_id]:
+            del self._renders_in_flight[key]
+        for key in [key for key in self._page_image_cache if key[0] == doc_id]:
+            image = self._page_image_cache.pop(key)
+            self._page_image_cache_bytes -= image.sizeInBytes()
+        if self._shown_page_key is not None and self._shown_page_key[0] == doc_id:
+            self._shown_page_key = None
+            self._shown_page_pixmap = None
+        if self._wanted_page_key is not None and self._wanted_page_key[0] == doc_id:
+            # Same key, new content: tiles still arriving show the old page.
+            self._render_generation += 1
+            self._wanted_page_key = None
+            self._progressive_pixmap = None
 
+    @staticmethod
+    def _logical_size(pixmap: QtGui.QPixmap) -> QtCore.QSize:
+        ratio = pixmap.devicePixelRatio() or 1.0
+        return QtCore.QSize(round(pixmap.width() / ratio), round(pixmap.height() / ratio))
+
+    def _present_page_pixmap(self, pixmap: QtGui.QPixmap) -> None:
         # Rebuild search highlights for current page if we have active search
         current_page_search_boxes: list[QtCore.QRectF] = []
+        scale = self._page_scale()
         if self._search_results and self._search_query:
             for page_index, rects in self._search_results:
                 if page_index == self._page_index:
                     current_page_search_boxes.extend([
-                        QtCore.QRectF(r.x0 * self._zoom, r.y0 * self._zoom, (r.x1 - r.x0) * self._zoom, (r.y1 - r.y0) * self._zoom)
+                        QtCore.QRectF(r.x0 * scale, r.y0 * scale, (r.x1 - r.x0) * scale, (r.y1 - r.y0) * scale)
                         for r in rects
                     ])
 
@@ -911,14 +1654,7 @@ class PdfViewerWidget(QtWidgets.QWidget):
             pixmap = pm_copy
 
         self._image_label.setPixmap(pixmap)
-        self._image_label.setMinimumSize(pixmap.size())
-        self._page_indicator_text = (
-            f"{self._document.display_name} — Page {self._page_index + 1} / {self._document.page_count}  "
-            f"(zoom: {self._zoom * 100:.0f}%)"
-        )
-        self._update_page_indicator_label()
-        self._update_action_states()
-        self._sync_page_scrollbar()
+        self._image_label.setMinimumSize(self._logical_size(pixmap))
 
     def _update_action_states(self) -> None:
         has_doc = self._document is not None
@@ -1036,7 +1772,8 @@ class PdfViewerWidget(QtWidgets.QWidget):
             if self._fit_mode:
                 self._apply_fit()
 
-        QtCore.QTimer.singleShot(0, apply)
+        # Coalesce live resize ticks into at most one fit per 100 ms.
+        QtCore.QTimer.singleShot(100, apply)
 
     def _apply_fit(self) -> None:
         if not self._document or not self._fit_mode:
@@ -1047,6 +1784,14 @@ class PdfViewerWidget(QtWidgets.QWidget):
             return
 
         viewport = self._scroll_area.viewport().size()
+        fit_key = (id(self._document), self._page_index, self._fit_mode, rect.width, rect.height)
+        last_width, last_height = self._last_fit_viewport
+        if (
+            fit_key == self._last_fit_key
+            and abs(self._zoom - self._last_fit_zoom) < 0.0001
+            and abs(viewport.width() - last_width) + abs(viewport.height() - last_height) < 4
+        ):
+            return
         available_width = max(viewport.width() - 16, 1)
         available_height = max(viewport.height() - 16, 1)
 
@@ -1058,6 +1803,9 @@ class PdfViewerWidget(QtWidgets.QWidget):
             new_zoom = min(width_ratio, height_ratio)
 
         self._set_zoom(new_zoom, from_fit=True)
+        self._last_fit_key = fit_key
+        self._last_fit_viewport = (viewport.width(), viewport.height())
+        self._last_fit_zoom = self._zoom
 
     def _on_page_scrollbar_changed(self, value: int) -> None:
         if not self._document:
@@ -1096,9 +1844,13 @@ class PdfViewerWidget(QtWidgets.QWidget):
             self._page_indicator.setText("")
             return
 
-        metrics = self._page_indicator.fontMetrics()
-        available = max(self._page_indicator.width() - 16, 80)
-        elided = metrics.elidedText(self._page_indicator_text, QtCore.Qt.ElideMiddle, available)
+        # Width is floored to 4 px steps so resize ticks reuse the last result.
+        available = max(self._page_indicator.width() - 16, 80) // 4 * 4
+        text, width, elided = self._elide_cache
+        if text != self._page_indicator_text or width != available:
+            metrics = self._page_indicator.fontMetrics()
+            elided = metrics.elidedText(self._page_indicator_text, QtCore.Qt.ElideMiddle, available)
+            self._elide_cache = (self._page_indicator_text, available, elided)
         self._page_indicator.setText(elided)
 
     def current_document(self) -> Optional[PdfDocument]:
@@ -1264,22 +2016,24 @@ class PdfViewerWidget(QtWidgets.QWidget):
             rect_y0 = center_y - min_px * 0.5
             rect_y1 = center_y + min_px * 0.5
         
-        # Convert pixel coordinates to PDF coordinates (considering zoom)
-        pdf_x0 = rect_x0 / self._zoom
-        pdf_y0 = rect_y0 / self._zoom
-        pdf_x1 = rect_x1 / self._zoom
-        pdf_y1 = rect_y1 / self._zoom
+        # Convert pixel coordinates to PDF coordinates (at the rendered scale)
+        scale = self._page_scale()
+        pdf_x0 = rect_x0 / scale
+        pdf_y0 = rect_y0 / scale
+        pdf_x1 = rect_x1 / scale
+        pdf_y1 = rect_y1 / scale
 
         # Slightly expand selection to keep edge punctuation (e.g., braces)
-        pad = max(0.5, 1.0 / max(self._zoom, 0.001))
+        pad = max(0.5, 1.0 / max(scale, 0.001))
         clip_rect = fitz.Rect(pdf_x0 - pad, pdf_y0 - pad, pdf_x1 + pad, pdf_y1 + pad)
 
         selection_boxes: list[QtCore.QRectF] = []
 
         # 1) Char-level extraction for fine-grained selection
         try:
-            page = self._document.document.load_page(self._page_index)
-            raw = page.get_text("rawdict") or {}
+            with _FITZ_LOCK:
+                page = self._document.document.load_page(self._page_index)
+                raw = page.get_text("rawdict") or {}
             chars = []
             for block in raw.get("blocks", []):
                 if block.get("type", 0) != 0:
@@ -1322,7 +2076,7 @@ class PdfViewerWidget(QtWidgets.QWidget):
                         out.append("\n")
                         current_y = y0
                     out.append(c)
-                    rect = QtCore.QRectF(x0 * self._zoom, y0 * self._zoom, (x1 - x0) * self._zoom, (y1 - y0) * self._zoom)
+                    rect = QtCore.QRectF(x0 * scale, y0 * scale, (x1 - x0) * scale, (y1 - y0) * scale)
                     selection_boxes.append(rect)
                 text_joined = "".join(out).strip()
                 if text_joined:
@@ -1332,8 +2086,9 @@ class PdfViewerWidget(QtWidgets.QWidget):
 
         # 2) Try direct clip extraction (preserves punctuation and spacing)
         try:
-            page = self._document.document.load_page(self._page_index)
-            clip_text = page.get_text("text", clip=clip_rect).strip()
+            with _FITZ_LOCK:
+                page = self._document.document.load_page(self._page_index)
+                clip_text = page.get_text("text", clip=clip_rect).strip()
             if clip_text:
                 # Use the drawn rect as highlight when we don't have per-char boxes
                 selection_boxes = [QtCore.QRectF(rect_x0, rect_y0, rect_x1 - rect_x0, rect_y1 - rect_y0)]
@@ -1343,8 +2098,9 @@ class PdfViewerWidget(QtWidgets.QWidget):
 
         # 3) Word-level extraction with rect expansion
         try:
-            page = self._document.document.load_page(self._page_index)
-            words = page.get_text("words")  # (x0,y0,x1,y1, word, block, line, word_no)
+            with _FITZ_LOCK:
+                page = self._document.document.load_page(self._page_index)
+                words = page.get_text("words")  # (x0,y0,x1,y1, word, block, line, word_no)
             picked = [w for w in words if fitz.Rect(w[0:4]).intersects(clip_rect)]
             if picked:
                 picked.sort(key=lambda w: (round(w[1], 1), w[0]))
@@ -1364,7 +2120,7 @@ class PdfViewerWidget(QtWidgets.QWidget):
                 if current_line:
                     lines.append(" ".join(current_line))
                 selection_boxes = [
-                    QtCore.QRectF(w[0] * self._zoom, w[1] * self._zoom, (w[2] - w[0]) * self._zoom, (w[3] - w[1]) * self._zoom)
+                    QtCore.QRectF(w[0] * scale, w[1] * scale, (w[2] - w[0]) * scale, (w[3] - w[1]) * scale)
                     for w in picked
                 ]
                 return "\n".join(lines).strip(), selection_boxes
@@ -1387,12 +2143,22 @@ class PdfViewerWidget(QtWidgets.QWidget):
         mapped = self._image_label.mapFrom(self._scroll_area.viewport(), pos)
         pixmap = self._image_label.pixmap()
         if pixmap:
-            x = max(0, min(mapped.x(), pixmap.width()))
-            y = max(0, min(mapped.y(), pixmap.height()))
+            size = self._logical_size(pixmap)
+            x = max(0, min(mapped.x(), size.width()))
+            y = max(0, min(mapped.y(), size.height()))
             return QtCore.QPoint(x, y)
         return mapped
 
 
+# Wheel handling keyed by (Ctrl held, sign of the wheel delta).
+_WHEEL_ACTIONS: Dict[Tuple[bool, int], Callable[[PdfViewerWidget], None]] = {
+    (True, 1): PdfViewerWidget.zoom_in,
+    (True, -1): PdfViewerWidget.zoom_out,
+    (False, 1): PdfViewerWidget.go_to_previous_page,
+    (False, -1): PdfViewerWidget.go_to_next_page,
+}
+
+
 # ---- Main window --------------------------------------------------------------
 
 
@@ -1602,11 +2368,25 @@ class SettingsDialog(QtWidgets.QDialog):
 class MainWindow(QtWidgets.QMainWindow):
     """Primary application window with a vertical tab rail."""
 
+    RENDER_BUFFER_POOL_LIMIT = 2
+    DIR_LISTING_TTL = 5.0  # seconds a scanned directory listing is reused
+    DIR_LISTING_CACHE_SIZE = 32
+
     def __init__(self) -> None:
+        # Other windows may still hold staged writes this window is about to read.
+        MainWindow._flush_all_settings()
         super().__init__()
         self._app_title = "PDF Vertical Tabs Viewer v1.0.8"
         self.setWindowTitle(self._app_title)
         self._settings = QtCore.QSettings("PdfVertView", "PdfVerticalTabsViewer")
+        self._settings_dirty: Dict[str, object] = {}
+        self._settings_flush_timer = QtCore.QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(2000)
+        self._settings_flush_timer.timeout.connect(self._flush_settings)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_settings)
         geometry = self._settings.value("window/geometry", QtCore.QByteArray(), type=QtCore.QByteArray)
         if isinstance(geometry, QtCore.QByteArray) and not geometry.isEmpty():
             self.restoreGeometry(geometry)
@@ -1616,13 +2396,49 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._documents: Dict[Path, PdfDocument] = {}
         self._tab_items: Dict[Path, QtWidgets.QListWidgetItem] = {}
+        # id(tab item) -> document, so hot paths avoid QVariant round-trips
+        # through item.data(UserRole); items in _tab_items keep the ids alive.
+        self._item_to_doc: Dict[int, PdfDocument] = {}
+        # Persistent model indexes follow row shifts, so a tab's row can be
+        # read without scanning the list; see _tab_row.
+        self._tab_indexes: Dict[Path, QtCore.QPersistentModelIndex] = {}
+        # (compact mode, title) each tab label was last rendered with.
+        self._tab_label_state: Dict[Path, Tuple[bool, str]] = {}
         self._doc_identities: Dict[Path, FileIdentity] = {}
+        # Only the documents themselves are watched; a rename or delete shows
+        # up as a fileChanged event and recovery then scans the parent once.
         self._watched_files: Set[Path] = set()
-        self._watched_dirs: Dict[Path, int] = {}
+        # Names of the PDFs in recently scanned directories, keyed by directory
+        # and validated against its mtime. Only names are kept: a file can be
+        # rewritten without touching the directory, so stats are always fresh.
+        self._dir_listing_cache: "OrderedDict[Path, Tuple[int, float, list]]" = OrderedDict()
         self._watcher = QtCore.QFileSystemWatcher(self)
         self._watcher.fileChanged.connect(self._handle_watched_file_changed)
         self._watcher.directoryChanged.connect(self._handle_watched_directory_changed)
+        # Parent directory -> open documents that vanished without a rename
+        # match. Qt drops the file watch on rename/delete, so the directory is
+        # watched instead until the file reappears or a match turns up.
+        self._dir_to_missing_docs: Dict[Path, Set[Path]] = {}
+        # Watch additions/removals are applied in one addPaths/removePaths call
+        # per event-loop turn; file change bursts are drained every 250 ms.
+        self._pending_watch_add: Set[str] = set()
+        self._pending_watch_remove: Set[str] = set()
+        self._watch_flush_scheduled = False
+        self._dirty_paths: Set[Path] = set()
+        self._file_change_timer = QtCore.QTimer(self)
+        self._file_change_timer.setSingleShot(True)
+        self._file_change_timer.setInterval(250)
+        self._file_change_timer.timeout.connect(self._process_changed_files)
         self._secondary_windows: list[MainWindow] = []
+        self._render_buffer_pool: Dict[int, list[bytearray]] = {}
+        # Export renders abandoned mid-flight; their buffers return on finish.
+        self._abandoned_export_jobs: Dict[int, PageRenderJob] = {}
+        self._export_job_signals = PageRenderJobSignals(self)
+        self._export_job_signals.finished.connect(self._on_export_job_finished)
+        # Tab thumbnails live in Qt's shared pixmap cache (limit in KiB).
+        QtGui.QPixmapCache.setCacheLimit(64 * 1024)
+        self._thumbnail_signals = ThumbnailSignals(self)
+        self._thumbnail_signals.finished.connect(self._apply_document_thumbnail)
         self._open_additional_in_same_window = True
         self._delete_original_on_save_as = False
         self._default_fit_mode = "page"
@@ -1631,6 +2447,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._min_tab_width = 72
         self._max_tab_ratio = 0.8  # allow up to 80% of the window width
         self._tab_panel_visible = True
+        self._pending_label_refresh = False
         self._stored_tab_width = self._expanded_width
         self._tab_sort_mode = DEFAULT_TAB_SORT_MODE
         self._tab_recency: Dict[str, int] = {}
@@ -1661,6 +2478,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tab_list.currentItemChanged.connect(self._handle_tab_selection)
         self.tab_list.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.tab_list.customContextMenuRequested.connect(self._show_tab_context_menu)
+        # Built once; _show_tab_context_menu only runs it and dispatches.
+        self._tab_menu = QtWidgets.QMenu(self)
+        self._tab_menu_copy_name = self._tab_menu.addAction("파일명 복사")
+        self._tab_menu_copy_dir = self._tab_menu.addAction("전체경로 복사")
+        self._tab_menu_save_as = self._tab_menu.addAction("다른 이름으로 저장…")
+        self._tab_menu_folder = self._tab_menu.addAction("파일 위치 열기")
+        self._tab_menu.addSeparator()
+        self._tab_menu_close = self._tab_menu.addAction("닫기")
         self.tab_list.setMinimumWidth(self._min_tab_width)
         self.tab_list.setMaximumWidth(QtWidgets.QWIDGETSIZE_MAX)
         self.tab_list.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
@@ -1670,8 +2495,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tab_list.setLayoutDirection(LayoutLeftToRight)
         self.tab_list.setMovement(QtWidgets.QListView.Static)
         self.tab_list.setMovement(QtWidgets.QListView.Static)
+        # Lay out long tab lists in slices so inserts don't stall the event loop.
+        self.tab_list.setLayoutMode(QtWidgets.QListView.Batched)
+        self.tab_list.setBatchSize(64)
 
         self.status_label = StatusLabel("")
+        self._last_status_state: Optional[Tuple[int, str, str, bool, int, bool]] = None
         self.status_label.setAlignment(AlignLeft | AlignVCenter)
         self.status_label.setWordWrap(False)
         self.status_label.setMargin(6)
@@ -1850,6 +2679,7 @@ class MainWindow(QtWidgets.QMainWindow):
         info_menu.addAction(author_action)
 
     def _load_preferences(self) -> None:
+        MainWindow._flush_all_settings()
         compact_mode = read_bool_setting(self._settings, "ui/compact_tabs", False)
         self.set_compact_tabs_enabled(compact_mode)
 
@@ -1914,8 +2744,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         if not self._documents or self._open_additional_in_same_window:
-            for path in materialized:
-                self.open_document_from_path(path)
+            self.open_documents_from_paths(materialized)
             return
 
         self._open_paths_in_new_window(materialized)
@@ -1939,8 +2768,7 @@ class MainWindow(QtWidgets.QMainWindow):
         new_window = MainWindow()
         self._track_secondary_window(new_window)
         new_window.show()
-        for path in paths:
-            new_window.open_document_from_path(path)
+        new_window.open_documents_from_paths(paths)
         new_window.raise_()
         new_window.activateWindow()
 
@@ -1992,7 +2820,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _create_pdf_document(self, path: Path) -> Optional[PdfDocument]:
         try:
-            doc = fitz.open(_prepare_filesystem_path(path))
+            with _FITZ_LOCK:
+                doc = fitz.open(_prepare_filesystem_path(path))
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Open failed", f"{path.name}\n\n{exc}")
             return None
@@ -2016,12 +2845,12 @@ class MainWindow(QtWidgets.QMainWindow):
                     )
                     return None
 
-            metadata = doc.metadata or {}
+            with _FITZ_LOCK:
+                metadata = doc.metadata or {}
             title_text = (metadata.get("title") or "").strip()
             display = path.name
             icon_label = title_text or path.stem or display
-            thumbnail = PdfDocument._build_thumbnail_icon(doc, icon_label)
-            return PdfDocument(path=path, document=doc, display_name=display, thumbnail=thumbnail)
+            return PdfDocument(path=path, document=doc, display_name=display, icon_label=icon_label)
         except Exception as exc:
             doc.close()
             QtWidgets.QMessageBox.critical(self, "Open failed", f"{path.name}\n\n{exc}")
@@ -2030,7 +2859,8 @@ class MainWindow(QtWidgets.QMainWindow):
     @staticmethod
     def _authenticate_document(doc: fitz.Document, password: str) -> bool:
         try:
-            result = doc.authenticate(password)
+            with _FITZ_LOCK:
+                result = doc.authenticate(password)
         except Exception:
             result = False
         if isinstance(result, (bool, int)):
@@ -2083,6 +2913,23 @@ class MainWindow(QtWidgets.QMainWindow):
             document, normalized, insert_row=insert_row, make_current=make_current
         )
 
+    def open_documents_from_paths(self, paths: Iterable[Path]) -> None:
+        """Open a batch of documents, selecting only the last one that opened."""
+        last_opened: Optional[Path] = None
+        updates_were_enabled = self.tab_list.updatesEnabled()
+        if updates_were_enabled:
+            self.tab_list.setUpdatesEnabled(False)
+        try:
+            for path in paths:
+                self.open_document_from_path(path, make_current=False)
+                normalized = normalize_path(path)
+                if normalized in self._documents:
+                    last_opened = normalized
+        finally:
+            if updates_were_enabled:
+                self.tab_list.setUpdatesEnabled(True)
+        if last_opened is not None:
+            self._select_tab(last_opened)
 
     def _add_document_to_ui(
         self,
@@ -2103,26 +2950,22 @@ class MainWindow(QtWidgets.QMainWindow):
         item.setFlags(ItemIsEnabled | ItemIsSelectable)
         item.setIcon(document.thumbnail)
         item.setToolTip(str(normalized))
+        if document.cached_thumbnail() is None:
+            QtCore.QThreadPool.globalInstance().start(ThumbnailTask(self._thumbnail_signals, document))
 
         if insert_row is None or insert_row >= self.tab_list.count():
+            insert_row = self.tab_list.count()
             self.tab_list.addItem(item)
         else:
             self.tab_list.insertItem(insert_row, item)
+        self._remember_tab_index(normalized, insert_row)
 
         self._documents[normalized] = document
         self._tab_items[normalized] = item
+        self._item_to_doc[id(item)] = document
         self._add_watch(normalized)
         self._update_document_identity(normalized)
 
-        if (
-            self._last_save_directory is None
-            or self._last_save_directory == Path.cwd()
-            or (self._last_save_directory and not self._last_save_directory.exists())
-        ):
-            parent_dir = normalized.parent
-            if parent_dir.exists():
-                self._last_save_directory = parent_dir
-
         if (
             self._last_save_directory is None
             or self._last_save_directory == Path.cwd()
@@ -2135,14 +2978,26 @@ class MainWindow(QtWidgets.QMainWindow):
         if make_current:
             self._select_tab(normalized)
 
-        self._mark_document_recent(normalized)
-        self._sort_tabs()
         self._mark_document_recent(normalized)
         self._sort_tabs()
         self.close_action.setEnabled(True)
         self._refresh_tab_labels()
         self._update_status_label()
 
+    def _apply_document_thumbnail(self, document: object, image: QtGui.QImage) -> None:
+        if not isinstance(document, PdfDocument):
+            return
+        # Closed (or closed and reopened) before the preview finished: caching
+        # it would show a stale preview if the path is opened again later.
+        normalized = normalize_path(document.path)
+        if self._documents.get(normalized) is not document:
+            return
+        pixmap = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(document.thumbnail_key, pixmap)
+        item = self._tab_items.get(normalized)
+        if item is not None and self._item_to_doc.get(id(item)) is document:
+            item.setIcon(QtGui.QIcon(pixmap))
+
     def close_current_document(self) -> None:
         current_item = self.tab_list.currentItem()
         if not current_item:
@@ -2152,29 +3007,76 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path_str:
             return
 
-        normalized = normalize_path(Path(path_str))
-        row = self.tab_list.row(current_item)
-        self.tab_list.takeItem(row)
-        self._cleanup_document_path(normalized)
-
+        row = self._close_documents([Path(path_str)])
         if self.tab_list.count() == 0:
             self.viewer.clear()
             self.close_action.setEnabled(False)
             self._update_status_label()
             return
 
-        new_row = min(row, self.tab_list.count() - 1)
-        self.tab_list.setCurrentRow(new_row)
+        self._select_row_after_close(row)
         self._refresh_tab_labels()
         self.close_action.setEnabled(self.tab_list.count() > 0)
         self._update_status_label()
 
+    def _close_documents(self, paths: Iterable[Path]) -> int:
+        """Remove the tabs of ``paths`` and close their documents.
+
+        Rows are taken back to front with list updates and signals suspended,
+        so the list neither repaints nor changes selection per removal. Returns
+        the lowest removed row (-1 if none); the caller settles the selection.
+        """
+        targets = []
+        for path in paths:
+            normalized = normalize_path(path)
+            item = self._tab_items.get(normalized)
+            targets.append((self._tab_row(item) if item is not None else -1, normalized))
+        targets.sort(key=lambda target: target[0], reverse=True)
+
+        updates_were_enabled = self.tab_list.updatesEnabled()
+        if updates_were_enabled:
+            self.tab_list.setUpdatesEnabled(False)
+        self.tab_list.blockSignals(True)
+        try:
+            for row, normalized in targets:
+                if row >= 0:
+                    self.tab_list.takeItem(row)
+                self._cleanup_document_path(normalized)
+        finally:
+            self.tab_list.blockSignals(False)
+            if updates_were_enabled:
+                self.tab_list.setUpdatesEnabled(True)
+        rows = [row for row, _ in targets if row >= 0]
+        return min(rows) if rows else -1
+
+    def _select_row_after_close(self, row: int) -> None:
+        """Select the tab that took ``row``'s place and show it once."""
+        count = self.tab_list.count()
+        if count:
+            self.tab_list.blockSignals(True)
+            self.tab_list.setCurrentRow(min(max(row, 0), count - 1))
+            self.tab_list.blockSignals(False)
+        self._handle_tab_selection(self.tab_list.currentItem(), None)
+
     def _select_tab(self, path: Path) -> None:
         item = self._tab_items.get(path)
         if item:
-            row = self.tab_list.row(item)
+            row = self._tab_row(item)
             self.tab_list.setCurrentRow(row)
 
+    def _remember_tab_index(self, path: Path, row: int) -> None:
+        self._tab_indexes[path] = QtCore.QPersistentModelIndex(self.tab_list.model().index(row, 0))
+
+    def _tab_row(self, item: QtWidgets.QListWidgetItem) -> int:
+        """Row of a tab item, read from its persistent index when still valid."""
+        path_text = item.data(PATH_ROLE)
+        index = self._tab_indexes.get(Path(path_text)) if path_text else None
+        if index is not None and index.isValid():
+            row = index.row()
+            if self.tab_list.item(row) is item:
+                return row
+        return self.tab_list.row(item)
+
     def _handle_tab_selection(
         self,
         current: Optional[QtWidgets.QListWidgetItem],
@@ -2185,16 +3087,17 @@ class MainWindow(QtWidgets.QMainWindow):
             self._update_status_label()
             return
 
-        document = current.data(UserRole)
-        if isinstance(document, PdfDocument):
-            self.viewer.load_document(document)
+        document = self._item_to_doc.get(id(current))
+        if document is not None:
+            # Re-selecting the tab already on screen (e.g. after a re-sort)
+            # must not reset the page and zoom or re-render it.
+            if document is not self.viewer.current_document():
+                self.viewer.load_document(document)
             self._mark_document_recent(document.path)
             if self._tab_sort_mode == TAB_SORT_RECENT:
                 self._sort_tabs()
-            self._mark_document_recent(document.path)
-            if self._tab_sort_mode == TAB_SORT_RECENT:
-                self._sort_tabs()
-        self.setWindowTitle(self._app_title)
+        if self.windowTitle() != self._app_title:
+            self.setWindowTitle(self._app_title)
         self._update_status_label()
 
     def toggle_compact_tabs(self) -> None:
@@ -2210,33 +3113,44 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         self._compact_mode = enabled
-        if enabled:
-            width = 72
-            self.tab_list.setMinimumWidth(width)
-            self.tab_list.setMaximumWidth(width)
-            self.tab_list.setViewMode(QtWidgets.QListView.IconMode)
-            self.tab_list.setResizeMode(QtWidgets.QListView.Adjust)
-            self.tab_list.setLayoutDirection(LayoutRightToLeft)
-            self.tab_list.set_base_min_width(width)
-            self.tab_panel.setMinimumWidth(width)
-            self.tab_panel.setMaximumWidth(width)
-            self._apply_tab_width(width)
-        else:
-            self.tab_list.setMinimumWidth(self._min_tab_width)
-            self.tab_list.setViewMode(QtWidgets.QListView.ListMode)
-            self.tab_list.setResizeMode(QtWidgets.QListView.Fixed)
-            self.tab_list.setMaximumWidth(QtWidgets.QWIDGETSIZE_MAX)
-            self.tab_list.setLayoutDirection(LayoutLeftToRight)
-            self.tab_list.set_base_min_width(self._min_tab_width)
-            self.tab_panel.setMinimumWidth(self._min_tab_width)
-            self.tab_panel.setMaximumWidth(QtWidgets.QWIDGETSIZE_MAX)
-            self._apply_tab_width(self._expanded_width)
-        self.tab_list.setMovement(QtWidgets.QListView.Static)
-        self.tab_list.setMovement(QtWidgets.QListView.Static)
+        # Hold repaints while the view properties change so the switch costs
+        # one layout pass instead of one per setter.
+        updates_were_enabled = self.tab_panel.updatesEnabled()
+        if updates_were_enabled:
+            self.tab_panel.setUpdatesEnabled(False)
+        try:
+            # Compact tabs are icon-only and all the same size; expanded tabs
+            # word-wrap their titles, so only compact mode can skip measuring.
+            self.tab_list.setUniformItemSizes(enabled)
+            if enabled:
+                width = 72
+                self.tab_list.setMinimumWidth(width)
+                self.tab_list.setMaximumWidth(width)
+                self.tab_list.setViewMode(QtWidgets.QListView.IconMode)
+                self.tab_list.setResizeMode(QtWidgets.QListView.Adjust)
+                self.tab_list.setLayoutDirection(LayoutRightToLeft)
+                self.tab_list.set_base_min_width(width)
+                self.tab_panel.setMinimumWidth(width)
+                self.tab_panel.setMaximumWidth(width)
+                self._apply_tab_width(width)
+            else:
+                self.tab_list.setMinimumWidth(self._min_tab_width)
+                self.tab_list.setViewMode(QtWidgets.QListView.ListMode)
+                self.tab_list.setResizeMode(QtWidgets.QListView.Fixed)
+                self.tab_list.setMaximumWidth(QtWidgets.QWIDGETSIZE_MAX)
+                self.tab_list.setLayoutDirection(LayoutLeftToRight)
+                self.tab_list.set_base_min_width(self._min_tab_width)
+                self.tab_panel.setMinimumWidth(self._min_tab_width)
+                self.tab_panel.setMaximumWidth(QtWidgets.QWIDGETSIZE_MAX)
+                self._apply_tab_width(self._expanded_width)
+            self.tab_list.setMovement(QtWidgets.QListView.Static)
+            self._refresh_tab_labels()
+            self._enforce_tab_limit()
+        finally:
+            if updates_were_enabled:
+                self.tab_panel.setUpdatesEnabled(True)
 
-        self._settings.setValue("ui/compact_tabs", enabled)
-        self._refresh_tab_labels()
-        self._enforce_tab_limit()
+        self._queue_setting("ui/compact_tabs", enabled)
         self._update_status_label()
 
     def set_tab_panel_visible(self, visible: bool) -> None:
@@ -2251,6 +3165,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self._tab_panel_visible = visible
         if visible:
             self.tab_panel.show()
+            if self._pending_label_refresh:
+                self._refresh_tab_labels()
             desired = self._stored_tab_width
             if self._compact_mode:
                 desired = max(desired, self.tab_list.minimumWidth())
@@ -2269,29 +3185,24 @@ class MainWindow(QtWidgets.QMainWindow):
             self._splitter.setSizes([total, 0])
             self._splitter.blockSignals(False)
 
-        self._settings.setValue("ui/tab_panel_visible", self._tab_panel_visible)
+        self._queue_setting("ui/tab_panel_visible", self._tab_panel_visible)
 
     def set_open_in_same_window(self, enabled: bool) -> None:
         if self._open_additional_in_same_window == enabled:
             return
         self._open_additional_in_same_window = enabled
-        self._settings.setValue("behavior/open_in_same_window", enabled)
-        try:
-            self._settings.sync()
-        except Exception:
-            pass
+        self._queue_setting("behavior/open_in_same_window", enabled)
+        self._flush_settings()
 
     def set_delete_original_on_save_as(self, enabled: bool) -> None:
         if self._delete_original_on_save_as == enabled:
             return
         self._delete_original_on_save_as = enabled
-        self._settings.setValue("behavior/delete_original_on_save_as", enabled)
-        try:
-            self._settings.sync()
-        except Exception:
-            pass
+        self._queue_setting("behavior/delete_original_on_save_as", enabled)
+        self._flush_settings()
 
     def _read_string_setting(self, key: str, default: str) -> str:
+        MainWindow._flush_all_settings()
         value = self._settings.value(key, default)
         if isinstance(value, str):
             return value
@@ -2308,7 +3219,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._default_fit_mode = normalized
         self.viewer.set_default_fit_mode(normalized)
         if persist:
-            self._settings.setValue("ui/default_fit_mode", normalized)
+            self._queue_setting("ui/default_fit_mode", normalized)
 
     def _apply_tab_sort_mode(self, mode: str, *, persist: bool) -> None:
         normalized = mode if mode in TAB_SORT_MODES else DEFAULT_TAB_SORT_MODE
@@ -2317,7 +3228,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self._tab_sort_mode = normalized
         if persist:
-            self._settings.setValue("ui/tab_sort_mode", normalized)
+            self._queue_setting("ui/tab_sort_mode", normalized)
         if normalized != previous:
             self._sort_tabs()
 
@@ -2361,11 +3272,14 @@ class MainWindow(QtWidgets.QMainWindow):
         current_item = self.tab_list.currentItem()
         self.tab_list.blockSignals(True)
         for target_index, item in enumerate(ordered):
-            current_index = self.tab_list.row(item)
+            current_index = self._tab_row(item)
             if current_index == target_index or current_index < 0:
                 continue
             taken = self.tab_list.takeItem(current_index)
             self.tab_list.insertItem(target_index, taken)
+            path_text = taken.data(PATH_ROLE)
+            if path_text:
+                self._remember_tab_index(Path(path_text), target_index)
         self.tab_list.blockSignals(False)
         if current_item:
             self.tab_list.blockSignals(True)
@@ -2388,119 +3302,58 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _item_path_key(self, item: QtWidgets.QListWidgetItem) -> str:
         path_str = item.data(PATH_ROLE)
-        return str(path_str) if path_str else ""
+        return os.path.normcase(str(path_str)) if path_str else ""
 
     def _mark_document_recent(self, path: Path) -> None:
         try:
             normalized_path = normalize_path(path)
         except Exception:
             normalized_path = path
-        key = str(normalized_path)
+        key = os.path.normcase(str(normalized_path))
         self._recency_counter += 1
         self._tab_recency[key] = self._recency_counter
         if self._tab_sort_mode == TAB_SORT_RECENT:
             self._move_tab_to_index(normalized_path, 0)
 
-    def _apply_tab_sort_mode(self, mode: str, *, persist: bool) -> None:
-        normalized = mode if mode in TAB_SORT_MODES else DEFAULT_TAB_SORT_MODE
-        previous = self._tab_sort_mode
-        if normalized == previous and not persist:
-            return
-        self._tab_sort_mode = normalized
-        if persist:
-            self._settings.setValue("ui/tab_sort_mode", normalized)
-        if normalized != previous:
-            self._sort_tabs()
-
-    def _sort_tabs(self) -> None:
-        count = self.tab_list.count()
-        if count <= 1:
-            return
-
-        items = [self.tab_list.item(index) for index in range(count)]
-        if any(item is None for item in items):
-            return
-
-        if self._tab_sort_mode == TAB_SORT_RECENT:
-            ordered = sorted(
-                items,
-                key=lambda item: self._tab_recency.get(self._item_path_key(item), 0),
-                reverse=True,
-            )
-            if ordered == items:
-                return
-            self._reorder_tab_items(ordered)
-            return
-
-        if self._tab_sort_mode not in (TAB_SORT_NAME_ASC, TAB_SORT_NAME_DESC):
-            return
-
-        reverse = self._tab_sort_mode == TAB_SORT_NAME_DESC
-
-        def name_key(item: QtWidgets.QListWidgetItem) -> tuple[str, str]:
-            display = (item.data(TITLE_ROLE) or "").casefold()
-            fallback = self._item_path_key(item)
-            return (display, fallback.casefold())
-
-        ordered = sorted(items, key=name_key, reverse=reverse)
-        if ordered == items:
-            return
-
-        self._reorder_tab_items(ordered)
-
-    def _reorder_tab_items(self, ordered: list[QtWidgets.QListWidgetItem]) -> None:
-        current_item = self.tab_list.currentItem()
-        self.tab_list.blockSignals(True)
-        for target_index, item in enumerate(ordered):
-            current_index = self.tab_list.row(item)
-            if current_index == target_index or current_index < 0:
-                continue
-            taken = self.tab_list.takeItem(current_index)
-            self.tab_list.insertItem(target_index, taken)
-        self.tab_list.blockSignals(False)
-        if current_item:
-            self.tab_list.blockSignals(True)
-            self.tab_list.setCurrentItem(current_item)
-            self.tab_list.blockSignals(False)
-        self._refresh_tab_labels()
-        self._update_status_label()
-
-    def _move_tab_to_index(self, path: Path, target_index: int) -> None:
-        item = self._tab_items.get(path)
-        if not item:
+    def _refresh_tab_labels(self) -> None:
+        # A hidden rail is not painted; catch up when it is shown again.
+        if not self._tab_panel_visible:
+            self._pending_label_refresh = True
             return
-        items = [self.tab_list.item(index) for index in range(self.tab_list.count())]
-        if item not in items:
+        self._pending_label_refresh = False
+        compact = self._compact_mode
+        pending = []
+        for path, item in self._tab_items.items():
+            display = item.data(TITLE_ROLE) or ""
+            if self._tab_label_state.get(path) != (compact, display):
+                pending.append((path, item, display))
+        if not pending:
             return
-        items.remove(item)
-        target_index = max(0, min(target_index, len(items)))
-        items.insert(target_index, item)
-        self._reorder_tab_items(items)
 
-    def _item_path_key(self, item: QtWidgets.QListWidgetItem) -> str:
-        path_str = item.data(PATH_ROLE)
-        return str(path_str) if path_str else ""
-
-    def _mark_document_recent(self, path: Path) -> None:
+        # Write each item's roles in one setItemData call with per-item
+        # dataChanged suppressed; a single layoutChanged then relayouts and
+        # repaints the list once.
+        model = self.tab_list.model()
+        # Callers such as open_documents_from_paths may already hold updates
+        # off for a whole batch; only re-enable what this method disabled.
+        updates_were_enabled = self.tab_list.updatesEnabled()
+        if updates_were_enabled:
+            self.tab_list.setUpdatesEnabled(False)
+        model.layoutAboutToBeChanged.emit()
+        model.blockSignals(True)
         try:
-            normalized_path = normalize_path(path)
-        except Exception:
-            normalized_path = path
-        key = str(normalized_path)
-        self._recency_counter += 1
-        self._tab_recency[key] = self._recency_counter
-        if self._tab_sort_mode == TAB_SORT_RECENT:
-            self._move_tab_to_index(normalized_path, 0)
-
-    def _refresh_tab_labels(self) -> None:
-        for index in range(self.tab_list.count()):
-            item = self.tab_list.item(index)
-            display = item.data(TITLE_ROLE) or ""
-            if self._compact_mode:
-                item.setText("")
-                item.setToolTip(display)
-            else:
-                item.setText(display)
+            for path, item, display in pending:
+                if compact:
+                    roles = {QtCore.Qt.DisplayRole: "", QtCore.Qt.ToolTipRole: display}
+                else:
+                    roles = {QtCore.Qt.DisplayRole: display}
+                model.setItemData(self.tab_list.indexFromItem(item), roles)
+                self._tab_label_state[path] = (compact, display)
+        finally:
+            model.blockSignals(False)
+            model.layoutChanged.emit()
+            if updates_were_enabled:
+                self.tab_list.setUpdatesEnabled(True)
 
     def _update_status_label(self) -> None:
         count = len(self._documents)
@@ -2510,12 +3363,26 @@ class MainWindow(QtWidgets.QMainWindow):
         current_document: Optional[PdfDocument] = None
         current_item = self.tab_list.currentItem()
         if current_item:
-            document = current_item.data(UserRole)
-            if isinstance(document, PdfDocument):
+            document = self._item_to_doc.get(id(current_item))
+            if document is not None:
                 current_document = document
                 current_name = document.display_name
                 current_path = str(document.path)
 
+        # Selection, open and resize events often repeat the same state;
+        # skip re-eliding and re-setting the label when nothing changed.
+        state = (
+            count,
+            current_name,
+            current_path,
+            self._compact_mode,
+            self.status_label.width(),
+            self.viewer.current_document() is not None,
+        )
+        if state == self._last_status_state:
+            return
+        self._last_status_state = state
+
         if current_path:
             metrics = self.status_label.fontMetrics()
             prefix = f"{base_text} | 현재: {current_name} | 위치: "
@@ -2532,50 +3399,74 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_modify_actions_state(current_document)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # type: ignore[override]
-        self._settings.setValue("window/geometry", self.saveGeometry())
-        try:
-            self._settings.sync()
-        except Exception:
-            pass
+        self._settings_dirty["window/geometry"] = self.saveGeometry()
+        self._flush_settings()
         super().closeEvent(event)
     def _add_watch(self, path: Path) -> None:
         normalized = normalize_path(path)
         if normalized not in self._watched_files:
-            try:
-                self._watcher.addPath(str(normalized))
-            except Exception:
-                pass
+            self._queue_watch_change(str(normalized), add=True)
             self._watched_files.add(normalized)
 
-        directory = normalize_path(normalized.parent)
-        count = self._watched_dirs.get(directory, 0)
-        if count == 0:
-            try:
-                self._watcher.addPath(str(directory))
-            except Exception:
-                pass
-        self._watched_dirs[directory] = count + 1
-
     def _remove_watch(self, path: Path) -> None:
         normalized = normalize_path(path)
         if normalized in self._watched_files:
+            self._queue_watch_change(str(normalized), add=False)
+            self._watched_files.discard(normalized)
+        self._release_directory_fallback(normalized)
+
+    def _watch_directory_for(self, path: Path) -> None:
+        directory = path.parent
+        documents = self._dir_to_missing_docs.get(directory)
+        if documents is None:
+            documents = self._dir_to_missing_docs[directory] = set()
+            self._queue_watch_change(str(directory), add=True)
+        documents.add(path)
+
+    def _release_directory_fallback(self, path: Path) -> None:
+        directory = path.parent
+        documents = self._dir_to_missing_docs.get(directory)
+        if documents is None or path not in documents:
+            return
+        documents.discard(path)
+        if not documents:
+            del self._dir_to_missing_docs[directory]
+            self._queue_watch_change(str(directory), add=False)
+
+    def _queue_watch_change(self, path_text: str, add: bool) -> None:
+        # An add and a remove of the same path within one turn cancel out.
+        if add:
+            if path_text in self._pending_watch_remove:
+                self._pending_watch_remove.discard(path_text)
+            else:
+                self._pending_watch_add.add(path_text)
+        elif path_text in self._pending_watch_add:
+            self._pending_watch_add.discard(path_text)
+        else:
+            self._pending_watch_remove.add(path_text)
+        if not self._watch_flush_scheduled:
+            self._watch_flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush_watch_changes)
+
+    def _flush_watch_changes(self) -> None:
+        self._watch_flush_scheduled = False
+        removals = sorted(self._pending_watch_remove)
+        additions = sorted(self._pending_watch_add)
+        self._pending_watch_remove.clear()
+        self._pending_watch_add.clear()
+        if removals:
             try:
-                self._watcher.removePath(str(normalized))
+                self._watcher.removePaths(removals)
             except Exception:
                 pass
-            self._watched_files.discard(normalized)
-
-        directory = normalize_path(normalized.parent)
-        count = self._watched_dirs.get(directory, 0) - 1
-        if count <= 0:
-            if directory in self._watched_dirs:
-                self._watched_dirs.pop(directory, None)
+        if additions:
             try:
-                self._watcher.removePath(str(directory))
+                failed = self._watcher.addPaths(additions)
             except Exception:
-                pass
-        else:
-            self._watched_dirs[directory] = count
+                failed = additions
+            # Forget paths the watcher refused so a later _add_watch retries them.
+            for path_text in failed:
+                self._watched_files.discard(Path(path_text))
 
     def _update_document_identity(self, path: Path) -> None:
         normalized = normalize_path(path)
@@ -2587,47 +3478,62 @@ class MainWindow(QtWidgets.QMainWindow):
         path = normalize_path(Path(path_str))
         if path not in self._documents:
             return
-        if path.exists():
-            self._update_document_identity(path)
-            return
-
-        QtCore.QTimer.singleShot(250, lambda p=path: self._attempt_recover_renamed_file(p))
+        # One persistent timer drains the pending set at most every 250 ms.
+        # It is not restarted while armed, so a continuous stream of events
+        # (a file being rewritten in a loop) cannot postpone recovery forever.
+        self._dirty_paths.add(path)
+        if not self._file_change_timer.isActive():
+            self._file_change_timer.start()
+
+    def _process_changed_files(self) -> None:
+        dirty = list(self._dirty_paths)
+        self._dirty_paths.clear()
+        watched = set(self._watcher.files())
+        for path in dirty:
+            if path not in self._documents:
+                continue
+            if path.exists():
+                self._release_directory_fallback(path)
+                self._update_document_identity(path)
+                # Atomic saves replace the file and the watcher drops it.
+                if str(path) not in watched:
+                    self._watched_files.discard(path)
+                    self._add_watch(path)
+            elif not self._attempt_recover_renamed_file(path):
+                # The watcher has dropped the vanished file; watch its parent
+                # so a later restore or rename brings us back here.
+                self._watched_files.discard(path)
+                self._watch_directory_for(path)
 
     def _handle_watched_directory_changed(self, directory_str: str) -> None:
-        directory = normalize_path(Path(directory_str))
-        missing = [
-            doc_path
-            for doc_path in list(self._documents.keys())
-            if doc_path.parent == directory and not doc_path.exists()
-        ]
-        if not missing:
+        documents = self._dir_to_missing_docs.get(normalize_path(Path(directory_str)))
+        if not documents:
             return
+        self._dirty_paths.update(documents)
+        if not self._file_change_timer.isActive():
+            self._file_change_timer.start()
 
-        def trigger_recovery(paths: list[Path]) -> None:
-            for doc_path in paths:
-                self._attempt_recover_renamed_file(doc_path)
-
-        QtCore.QTimer.singleShot(250, lambda paths=missing: trigger_recovery(paths))
-
-    def _attempt_recover_renamed_file(self, old_path: Path) -> None:
+    def _attempt_recover_renamed_file(self, old_path: Path) -> bool:
+        """Follow a vanished document to its renamed file; return whether one was found."""
         normalized = normalize_path(old_path)
         if normalized not in self._documents:
-            return
+            return False
 
         identity = self._doc_identities.get(normalized)
         if not identity:
-            return
+            return False
 
         directory = normalize_path(normalized.parent)
         candidate = self._find_identity_match(directory, identity, normalized)
         if not candidate:
-            return
+            return False
 
         candidate_normalized = normalize_path(candidate)
         if candidate_normalized == normalized:
-            return
+            return False
 
         self._handle_document_renamed(normalized, candidate_normalized)
+        return True
 
     def _find_identity_match(
         self,
@@ -2635,34 +3541,65 @@ class MainWindow(QtWidgets.QMainWindow):
         identity: FileIdentity,
         exclude: Path,
     ) -> Optional[Path]:
-        if not directory.exists():
+        names = self._directory_pdf_names(directory)
+        if names is None:
             return None
-
+        # "Save as" usually keeps most of the old name, so siblings sharing the
+        # longest prefix with it are statted first. An inode/device match is
+        # the renamed file itself and wins outright; a size+mtime match is
+        # weaker (a copy matches too), so the best-named one is kept as a
+        # fallback while the scan looks for an exact match.
+        old_stem = exclude.stem.lower()
+        ranked = sorted(
+            names,
+            key=lambda name: len(
+                os.path.commonprefix([old_stem, os.path.splitext(name)[0].lower()])
+            ),
+            reverse=True,
+        )
+        weak_match: Optional[Path] = None
+        for name in ranked:
+            entry_path = directory / name
+            if entry_path == exclude:
+                continue
+            candidate_identity = FileIdentity.from_path(entry_path)
+            if candidate_identity is None:
+                continue
+            if identity.same_file(candidate_identity):
+                return entry_path
+            if weak_match is None and identity.matches(candidate_identity):
+                if not identity.inode:
+                    # Without an inode no exact match can follow.
+                    return entry_path
+                weak_match = entry_path
+        return weak_match
+
+    def _directory_pdf_names(self, directory: Path) -> Optional[list]:
+        """Return the names of the PDFs in ``directory``, reusing a recent listing."""
         try:
-            entries = list(directory.iterdir())
+            dir_stat = os.stat(directory)
         except OSError:
             return None
+        now = time.monotonic()
+        cached = self._dir_listing_cache.get(directory)
+        if (
+            cached is not None
+            and cached[0] == dir_stat.st_mtime_ns
+            and now - cached[1] <= self.DIR_LISTING_TTL
+        ):
+            self._dir_listing_cache.move_to_end(directory)
+            return cached[2]
 
-        fallback: Optional[Path] = None
-        for entry in entries:
-            if entry == exclude or entry.suffix.lower() != ".pdf":
-                continue
-
-            candidate_identity = FileIdentity.from_path(entry)
-            if not candidate_identity:
-                continue
-
-            if identity.matches(candidate_identity):
-                return entry
-
-            if (
-                fallback is None
-                and identity.size == candidate_identity.size
-                and abs(identity.mtime_ns - candidate_identity.mtime_ns) <= 1_000_000
-            ):
-                fallback = entry
-
-        return fallback
+        try:
+            with os.scandir(directory) as scanner:
+                names = [entry.name for entry in scanner if entry.name.lower().endswith(".pdf")]
+        except OSError:
+            return None
+        self._dir_listing_cache[directory] = (dir_stat.st_mtime_ns, now, names)
+        self._dir_listing_cache.move_to_end(directory)
+        while len(self._dir_listing_cache) > self.DIR_LISTING_CACHE_SIZE:
+            self._dir_listing_cache.popitem(last=False)
+        return names
 
     def _handle_document_renamed(self, old_path: Path, new_path: Path) -> None:
         item = self._tab_items.get(old_path)
@@ -2670,39 +3607,52 @@ class MainWindow(QtWidgets.QMainWindow):
         if not item or not document:
             return
 
-        row = self.tab_list.row(item)
+        row = self._tab_row(item)
         normalized_new = normalize_path(new_path)
         if normalized_new in self._documents:
             was_current = self.tab_list.currentItem() is item
-            self.tab_list.takeItem(row)
-            self._cleanup_document_path(old_path)
-            if was_current and self.tab_list.count():
-                self.tab_list.setCurrentRow(min(row, self.tab_list.count() - 1))
+            self._close_documents([old_path])
+            if was_current:
+                self._select_row_after_close(row)
             self.close_action.setEnabled(self.tab_list.count() > 0)
             self._update_status_label()
             return
 
         was_current = self.tab_list.currentItem() is item
-        self.tab_list.takeItem(row)
-        self._cleanup_document_path(old_path)
-        self.open_document_from_path(normalized_new, insert_row=row, make_current=was_current)
-        if was_current:
-            self.tab_list.setCurrentRow(row)
+        # Open the renamed file before dropping the old tab, so a failed open
+        # never leaves a closed PdfDocument behind in the viewer or tab list.
+        new_document = self._create_pdf_document(normalized_new)
+        self._close_documents([old_path])
+        if new_document is None:
+            if was_current:
+                self._select_row_after_close(row)
+        else:
+            self._add_document_to_ui(
+                new_document, normalized_new, insert_row=row, make_current=was_current
+            )
+            if was_current:
+                self.tab_list.setCurrentRow(row)
         self.close_action.setEnabled(self.tab_list.count() > 0)
         self._update_status_label()
 
     def _cleanup_document_path(self, path: Path, close_document: bool = True) -> None:
         normalized = normalize_path(path)
         document = self._documents.pop(normalized, None)
+        if document:
+            self.viewer.invalidate_document(document)
+            QtGui.QPixmapCache.remove(document.thumbnail_key)
         if close_document and document:
             try:
                 document.close()
             except Exception:
                 pass
-        self._tab_items.pop(normalized, None)
+        item = self._tab_items.pop(normalized, None)
+        if item is not None:
+            self._item_to_doc.pop(id(item), None)
+        self._tab_indexes.pop(normalized, None)
+        self._tab_label_state.pop(normalized, None)
         self._doc_identities.pop(normalized, None)
-        self._tab_recency.pop(str(normalized), None)
-        self._tab_recency.pop(str(normalized), None)
+        self._tab_recency.pop(os.path.normcase(str(normalized)), None)
         self._remove_watch(normalized)
 
     def _show_tab_context_menu(self, point: QtCore.QPoint) -> None:
@@ -2710,38 +3660,26 @@ class MainWindow(QtWidgets.QMainWindow):
         if not item:
             return
 
-        document = item.data(UserRole)
-        if not isinstance(document, PdfDocument):
+        document = self._item_to_doc.get(id(item))
+        if document is None:
             return
 
-        menu = QtWidgets.QMenu(self)
-        copy_name_action = menu.addAction("파일명 복사")
-        copy_dir_action = menu.addAction("전체경로 복사")
-        copy_dir_action = menu.addAction("전체경로 복사")
-        save_as_action = menu.addAction("다른 이름으로 저장…")
-        folder_action = menu.addAction("파일 위치 열기")
-        menu.addSeparator()
-        close_action = menu.addAction("닫기")
-
-        selected = menu.exec(self.tab_list.mapToGlobal(point))
+        selected = self._tab_menu.exec(self.tab_list.mapToGlobal(point))
         if selected is None:
             return
 
-        if selected == copy_name_action:
+        if selected is self._tab_menu_copy_name:
             self.tab_list.setCurrentItem(item)
             QtWidgets.QApplication.clipboard().setText(document.path.name)
-        elif selected == copy_dir_action:
+        elif selected is self._tab_menu_copy_dir:
             self.tab_list.setCurrentItem(item)
             QtWidgets.QApplication.clipboard().setText(_display_path_text(document.path.parent))
-        elif selected == copy_dir_action:
-            self.tab_list.setCurrentItem(item)
-            QtWidgets.QApplication.clipboard().setText(_display_path_text(document.path.parent))
-        elif selected == save_as_action:
+        elif selected is self._tab_menu_save_as:
             self.tab_list.setCurrentItem(item)
             self._save_document_as(document)
-        elif selected == folder_action:
+        elif selected is self._tab_menu_folder:
             self._open_document_directory(document)
-        elif selected == close_action:
+        elif selected is self._tab_menu_close:
             self.tab_list.setCurrentItem(item)
             self.close_current_document()
 
@@ -2778,37 +3716,35 @@ class MainWindow(QtWidgets.QMainWindow):
         total = sum(sizes)
         if total <= 0:
             return
-        max_allowed = max(int(total * self._max_tab_ratio), self._min_tab_width)
-        tab_width = min(sizes[1], max_allowed)
-        viewer_width = max(total - tab_width, 1)
-        if tab_width != sizes[1]:
-            self._splitter.blockSignals(True)
-            self._splitter.setSizes([viewer_width, tab_width])
-            self._splitter.blockSignals(False)
-            sizes = self._splitter.sizes()
-        if len(sizes) >= 2:
-            self._stored_tab_width = sizes[1]
+        tab_width = min(sizes[1], self._max_tab_width(total))
+        self._set_splitter_sizes(max(total - tab_width, 1), tab_width, sizes)
 
     def _apply_tab_width(self, target_width: int) -> None:
         """Force the splitter so the tab rail occupies exactly the desired width."""
         if not self._tab_panel_visible:
             self._stored_tab_width = max(target_width, getattr(self, "_min_tab_width", 1))
             return
-        minimum = getattr(self, "_min_tab_width", 1)
-        target = max(target_width, minimum)
+        target = max(target_width, getattr(self, "_min_tab_width", 1))
         sizes = self._splitter.sizes()
         if len(sizes) < 2:
             return
         total = sum(sizes)
-        max_allowed = max(int(total * getattr(self, "_max_tab_ratio", 1.0)), minimum)
-        target = min(target, max_allowed)
+        target = min(target, self._max_tab_width(total))
         if total <= target:
             total = target + max(self.viewer.width(), 1)
-        viewer_width = max(total - target, 1)
-        self._splitter.blockSignals(True)
-        self._splitter.setSizes([viewer_width, target])
-        self._splitter.blockSignals(False)
-        sizes = self._splitter.sizes()
+        self._set_splitter_sizes(max(total - target, 1), target, sizes)
+
+    def _max_tab_width(self, total: int) -> int:
+        minimum = getattr(self, "_min_tab_width", 1)
+        return max(int(total * getattr(self, "_max_tab_ratio", 1.0)), minimum)
+
+    def _set_splitter_sizes(self, viewer_width: int, tab_width: int, sizes: list) -> None:
+        # setSizes relayouts even when nothing moves; skip sub-pixel changes.
+        if abs(viewer_width - sizes[0]) > 1 or abs(tab_width - sizes[1]) > 1:
+            self._splitter.blockSignals(True)
+            self._splitter.setSizes([viewer_width, tab_width])
+            self._splitter.blockSignals(False)
+            sizes = self._splitter.sizes()
         if len(sizes) >= 2:
             self._stored_tab_width = sizes[1]
 
@@ -2878,6 +3814,7 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as exc:  # pragma: no cover - defensive UI path.
             QtWidgets.QMessageBox.critical(self, "문서 회전 실패", str(exc))
             return
+        self.viewer.invalidate_document(document)
         if self.viewer.current_document() is document:
             self.viewer.refresh_current_page()
 
@@ -2892,6 +3829,7 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as exc:  # pragma: no cover - defensive UI path.
             QtWidgets.QMessageBox.critical(self, "페이지 회전 실패", str(exc))
             return
+        self.viewer.invalidate_document(document)
         self.viewer.refresh_current_page()
 
     def _save_changes(self) -> None:
@@ -2911,10 +3849,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         doc_obj = document.document
         try:
-            if hasattr(doc_obj, "can_save_incrementally") and doc_obj.can_save_incrementally():
-                doc_obj.saveIncr()
-            else:
-                doc_obj.save(str(path))
+            with _FITZ_LOCK:
+                if hasattr(doc_obj, "can_save_incrementally") and doc_obj.can_save_incrementally():
+                    doc_obj.saveIncr()
+                else:
+                    doc_obj.save(str(path))
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "변경사항 저장 실패", str(exc))
             return
@@ -3070,8 +4009,7 @@ class MainWindow(QtWidgets.QMainWindow):
         item = self.tab_list.currentItem()
         if not item:
             return None
-        document = item.data(UserRole)
-        return document if isinstance(document, PdfDocument) else None
+        return self._item_to_doc.get(id(item))
 
     def _prompt_document_choice(self) -> Optional[PdfDocument]:
         if not self._documents:
@@ -3133,6 +4071,16 @@ class MainWindow(QtWidgets.QMainWindow):
         if page_index is None:
             return
 
+        # Start rendering while the user is still picking a file name. The
+        # format is not known yet, but every export writer takes RGB888.
+        try:
+            pending_render = self._start_export_render(
+                document, page_index, 2.0, QtGui.QImage.Format_RGB888
+            )
+        except Exception as exc:  # pragma: no cover - defensive UI path.
+            QtWidgets.QMessageBox.critical(self, "그림 저장 실패", str(exc))
+            return
+
         suggested_name = f"{document.display_name}_p{page_index + 1:03d}.png"
         default_path = document.path.parent / suggested_name if document.path else Path.home() / suggested_name
         file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -3142,25 +4090,26 @@ class MainWindow(QtWidgets.QMainWindow):
             "PNG (*.png);;JPEG (*.jpg *.jpeg);;BMP (*.bmp);;All files (*)",
         )
         if not file_path:
+            self._abandon_export_render(pending_render)
             return
 
-        target = Path(file_path).expanduser()
-        if not target.suffix:
-            target = target.with_suffix(".png")
-
-        suffix_map = {
-            ".png": "PNG",
-            ".jpg": "JPG",
-            ".jpeg": "JPG",
-            ".bmp": "BMP",
-        }
-        image_format = suffix_map.get(target.suffix.lower(), "PNG")
-        if target.suffix.lower() not in suffix_map:
-            target = target.with_suffix(".png")
+        # Work on the plain string and build the Path exactly once.
+        target_text = os.path.expanduser(file_path)
+        root, suffix = os.path.splitext(target_text)
+        suffix = suffix.lower()
+        if suffix not in EXPORT_IMAGE_FORMATS:
+            target_text = f"{root}.png"
+            suffix = ".png"
+        image_format, render_format = EXPORT_IMAGE_FORMATS[suffix]
+        target = Path(target_text)
+        target_display = _display_path_text(target_text)
 
         try:
-            image = document.render_page(page_index, 2.0)
+            image = pending_render.result()
+            if image.format() != render_format:
+                image = image.convertToFormat(render_format)
         except Exception as exc:  # pragma: no cover - defensive UI path.
+            self._release_render_buffer(pending_render.buffer)
             QtWidgets.QMessageBox.critical(self, "그림 저장 실패", str(exc))
             return
 
@@ -3169,22 +4118,73 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
-        if not image.save(_prepare_filesystem_path(target), image_format):
+        saved = image.save(_prepare_filesystem_path(target), image_format)
+        del image  # the image views the pooled buffer; drop it before reuse
+        self._release_render_buffer(pending_render.buffer)
+        if not saved:
             QtWidgets.QMessageBox.critical(
                 self,
                 "그림 저장 실패",
-                f"{_display_path_text(target)}\n\n이미지를 저장할 수 없습니다.",
+                f"{target_display}\n\n이미지를 저장할 수 없습니다.",
             )
             return
 
         QtWidgets.QMessageBox.information(
             self,
             "그림 저장",
-            f"{_display_path_text(target)}\n\n이미지를 저장했습니다.",
+            f"{target_display}\n\n이미지를 저장했습니다.",
         )
 
 
 
+    def _start_export_render(
+        self,
+        document: PdfDocument,
+        page_index: int,
+        zoom: float,
+        target_format: QtGui.QImage.Format,
+    ) -> PageRenderJob:
+        """Queue a page render into a pooled buffer on the global thread pool."""
+        width, height = document.page_pixel_size(page_index, zoom)
+        buffer = self._acquire_render_buffer(width * height * RENDER_BYTES_PER_PIXEL[target_format])
+        job = PageRenderJob(
+            document, page_index, zoom, buffer, target_format, self._export_job_signals
+        )
+        QtCore.QThreadPool.globalInstance().start(job)
+        return job
+
+    def _abandon_export_render(self, job: PageRenderJob) -> None:
+        """Drop an export render without waiting for it on the GUI thread."""
+        job.cancel()
+        if job.is_done():
+            self._release_render_buffer(job.buffer)
+        else:
+            self._abandoned_export_jobs[id(job)] = job
+
+    def _on_export_job_finished(self, job: object) -> None:
+        abandoned = self._abandoned_export_jobs.pop(id(job), None)
+        if abandoned is not None:
+            self._release_render_buffer(abandoned.buffer)
+
+    def _acquire_render_buffer(self, size: int) -> bytearray:
+        """Return a pooled export buffer of exactly ``size`` bytes."""
+        buffers = self._render_buffer_pool.get(size)
+        if buffers:
+            return buffers.pop()
+        return bytearray(size)
+
+    def _release_render_buffer(self, buffer: bytearray) -> None:
+        """Hand an export buffer back to the pool, keeping only a few around."""
+        size = len(buffer)
+        buffers = self._render_buffer_pool.get(size)
+        if buffers is None:
+            if len(self._render_buffer_pool) >= self.RENDER_BUFFER_POOL_LIMIT:
+                oldest = next(iter(self._render_buffer_pool))
+                self._render_buffer_pool.pop(oldest, None)
+            buffers = self._render_buffer_pool[size] = []
+        if len(buffers) < self.RENDER_BUFFER_POOL_LIMIT:
+            buffers.append(buffer)
+
     def _update_modify_actions_state(self, current_document: Optional[PdfDocument]) -> None:
         has_any_document = bool(self._documents)
         has_current = current_document is not None
@@ -3205,12 +4205,32 @@ class MainWindow(QtWidgets.QMainWindow):
     def _remember_last_save_directory(self, directory: Path) -> None:
         normalized = normalize_path(directory)
         self._last_save_directory = normalized
-        self._settings.setValue("paths/last_save_dir", str(normalized))
+        self._queue_setting("paths/last_save_dir", str(normalized))
 
-    def _remember_last_save_directory(self, directory: Path) -> None:
-        normalized = normalize_path(directory)
-        self._last_save_directory = normalized
-        self._settings.setValue("paths/last_save_dir", str(normalized))
+    def _queue_setting(self, key: str, value: object) -> None:
+        """Stage a settings write; pending values are flushed together later."""
+        self._settings_dirty[key] = value
+        self._settings_flush_timer.start()
+
+    def _flush_settings(self) -> None:
+        """Write staged settings to the backing store in a single pass."""
+        self._settings_flush_timer.stop()
+        if not self._settings_dirty:
+            return
+        pending, self._settings_dirty = self._settings_dirty, {}
+        for key, value in pending.items():
+            self._settings.setValue(key, value)
+        try:
+            self._settings.sync()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _flush_all_settings() -> None:
+        """Flush the staged writes of every open window before reading QSettings."""
+        for widget in QtWidgets.QApplication.topLevelWidgets():
+            if isinstance(widget, MainWindow) and hasattr(widget, "_settings_dirty"):
+                widget._flush_settings()
 
     def _save_document_as(self, document: PdfDocument) -> None:
         suggested_path = document.path if document.path.suffix else document.path.with_suffix(".pdf")
@@ -3280,13 +4300,7 @@ class MainWindow(QtWidgets.QMainWindow):
             )
 
     def _open_document_directory(self, document: PdfDocument) -> None:
-        directory = document.path.parent
-        if sys.platform.startswith("win"):
-            os.startfile(directory)  # type: ignore[attr-defined]
-        elif sys.platform == "darwin":
-            QtCore.QProcess.startDetached("open", [str(directory)])
-        else:
-            QtCore.QProcess.startDetached("xdg-open", [str(directory)])
+        _open_directory(document.path.parent)
 
 
 # ---- Entrypoint ---------------------------------------------------------------
@@ -3308,8 +4322,8 @@ def main() -> int:
     window = MainWindow()
     window.show()
 
-    for path in existing_paths:
-        window.open_document_from_path(path)
+    if existing_paths:
+        window.open_documents_from_paths(existing_paths)
 
     return exec_qapplication(app)
 